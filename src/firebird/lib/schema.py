@@ -40,10 +40,14 @@
 """
 
 from __future__ import annotations
-from typing import Dict, Tuple, List, Any, Optional, Union
+from typing import Dict, Tuple, List, Any, Optional, Union, FrozenSet, Iterator, Iterable, Callable
+import sys
+import re
 import weakref
 import datetime
-from itertools import groupby
+from collections import deque
+from itertools import groupby, chain
+from operator import itemgetter
 from enum import auto, Enum, IntEnum, IntFlag
 from firebird.base.collections import DataList
 from firebird.driver import Connection, Cursor, Statement, Isolation, TraAccessMode, Error, tpb
@@ -453,8 +457,15 @@ class CollationFlag(IntFlag):
     CASE_INSENSITIVE = 2
     ACCENT_INSENSITIVE = 4
 
-#: List of default sections (in order) for `.Schema.get_metadata_ddl()`
-SCRIPT_DEFAULT_ORDER = [Section.COLLATIONS, Section.CHARACTER_SETS,
+#: PAD, CASE and ACCENT clauses of CREATE COLLATION, indexed by `CollationFlag` value
+_COLLATION_FLAG_SQL: Tuple[Tuple[str, str, str], ...] = tuple(
+    ('PAD SPACE' if flags & CollationFlag.PAD_SPACE else 'NO PAD',
+     'CASE INSENSITIVE' if flags & CollationFlag.CASE_INSENSITIVE else 'CASE SENSITIVE',
+     'ACCENT INSENSITIVE' if flags & CollationFlag.ACCENT_INSENSITIVE else 'ACCENT SENSITIVE')
+    for flags in range(8))
+
+#: Default sections (in order) for `.Schema.get_metadata_ddl()`
+SCRIPT_DEFAULT_ORDER = (Section.COLLATIONS, Section.CHARACTER_SETS,
                         Section.UDFS, Section.GENERATORS,
                         Section.EXCEPTIONS, Section.DOMAINS,
                         Section.PACKAGE_DEFS,
@@ -467,7 +478,291 @@ SCRIPT_DEFAULT_ORDER = [Section.COLLATIONS, Section.CHARACTER_SETS,
                         Section.PROCEDURE_BODIES,
                         Section.FUNCTION_BODIES, Section.TRIGGERS,
                         Section.GRANTS, Section.ROLES, Section.COMMENTS,
-                        Section.SHADOWS, Section.SET_GENERATORS]
+                        Section.SHADOWS, Section.SET_GENERATORS)
+
+#: Privileges granted on tables and views that may be restricted to columns
+_TABLE_PRIVS = frozenset([PrivilegeCode.SELECT, PrivilegeCode.INSERT, PrivilegeCode.UPDATE,
+                          PrivilegeCode.DELETE, PrivilegeCode.REFERENCES])
+#: Object type keywords for EXECUTE privilege (key = subject type)
+_EXECUTE_OBJECT_TYPES = {ObjectType.PROCEDURE: 'PROCEDURE', ObjectType.UDF: 'FUNCTION',
+                         ObjectType.PACKAGE_HEADER: 'PACKAGE'}
+#: Object type keywords for USAGE privilege (key = subject type)
+_USAGE_OBJECT_TYPES = {ObjectType.GENERATOR: 'SEQUENCE', ObjectType.EXCEPTION: 'EXCEPTION'}
+#: Object type keywords for CREATE, ALTER and DROP privileges (key = subject type)
+_DDL_OBJECT_TYPES = {ObjectType.RELATIONS: 'TABLE', ObjectType.VIEWS: 'VIEW',
+                     ObjectType.PROCEDURES: 'PROCEDURE', ObjectType.FUNCTIONS: 'FUNCTION',
+                     ObjectType.PACKAGES: 'PACKAGE', ObjectType.GENERATORS: 'SEQUENCE',
+                     ObjectType.DOMAINS: 'DOMAIN', ObjectType.EXCEPTIONS: 'EXCEPTION',
+                     ObjectType.ROLES: 'ROLE', ObjectType.CHARSETS: 'CHARACTER SET',
+                     ObjectType.COLLATIONS: 'COLLATION', ObjectType.FILTERS: 'FILTER'}
+
+#: Max. number of sequences which values are fetched by single query
+_SEQUENCE_BATCH_SIZE = 256
+#: Max. number of prepared metadata queries kept by `Schema`
+_MAX_PREPARED_STATEMENTS = 32
+
+#: Finds character that can't be used in unquoted identifier (or at its beginning)
+_needs_quoting_chars = re.compile(r'^[^A-Z]|[^A-Z0-9$_]').search
+#: Matches name of SchemaItem method that generates SQL command for action
+_SQL_GENERATOR_NAME = re.compile(r'_get_(\w+)_sql$').match
+
+#: Reserved words in Firebird 3
+_RESERVED_FB3 = frozenset(['ABS', 'ACOS', 'ACOSH', 'ACTIVE', 'ADD', 'ADMIN', 'AFTER',
+                           'ALL', 'ALTER', 'AND', 'ANY', 'AS', 'ASC', 'ASCENDING',
+                           'ASCII_CHAR', 'ASCII_VAL', 'ASIN', 'ASINH', 'AT', 'ATAN',
+                           'ATAN2', 'ATANH', 'AUTO', 'AUTONOMOUS', 'AVG', 'BEFORE',
+                           'BEGIN', 'BETWEEN', 'BIGINT', 'BIN_AND', 'BIN_NOT', 'BIN_OR',
+                           'BIN_SHL', 'BIN_SHR', 'BIN_XOR', 'BIT_LENGTH', 'BLOB',
+                           'BOOLEAN', 'BOTH', 'BY', 'CASE', 'CAST', 'CEIL', 'CEILING',
+                           'CHAR', 'CHAR_LENGTH', 'CHAR_TO_UUID', 'CHARACTER',
+                           'CHARACTER_LENGTH', 'CHECK', 'CLOSE', 'COLLATE', 'COLUMN',
+                           'COMMIT', 'COMMITTED', 'COMPUTED', 'CONDITIONAL', 'CONNECT',
+                           'CONSTRAINT', 'CONTAINING', 'CORR', 'COS', 'COSH', 'COT',
+                           'COUNT', 'COVAR_POP', 'COVAR_SAMP', 'CREATE', 'CROSS',
+                           'CSTRING', 'CURRENT', 'CURRENT_CONNECTION', 'CURRENT_DATE',
+                           'CURRENT_ROLE', 'CURRENT_TIME', 'CURRENT_TIMESTAMP',
+                           'CURRENT_TRANSACTION', 'CURRENT_USER', 'CURSOR', 'DATABASE',
+                           'DATE', 'DATEADD', 'DATEDIFF', 'DAY', 'DDL', 'DEC', 'DECIMAL',
+                           'DECLARE', 'DECODE', 'DEFAULT', 'DELETE', 'DENSE_RANK', 'DESC',
+                           'DESCENDING', 'DETERMINISTIC', 'DISCONNECT', 'DISTINCT', 'DO',
+                           'DOMAIN', 'DOUBLE', 'DROP', 'ELSE', 'END', 'ENTRY_POINT',
+                           'ESCAPE', 'EXCEPTION', 'EXECUTE', 'EXISTS', 'EXIT', 'EXP',
+                           'EXTERNAL', 'EXTRACT', 'FALSE', 'FETCH', 'FILE', 'FILTER',
+                           'FIRST_VALUE', 'FIRSTNAME', 'FLOAT', 'FLOOR', 'FOR', 'FOREIGN',
+                           'FROM', 'FULL', 'FUNCTION', 'GDSCODE', 'GENERATOR', 'GEN_ID',
+                           'GEN_UUID', 'GLOBAL', 'GRANT', 'GRANTED', 'GROUP', 'HASH',
+                           'HAVING', 'HOUR', 'IDENTITY', 'IF', 'IN', 'INACTIVE',
+                           'INCREMENT', 'INDEX', 'INNER', 'INPUT_TYPE', 'INSENSITIVE',
+                           'INSERT', 'INT', 'INTEGER', 'INTO', 'IS', 'ISOLATION', 'JOIN',
+                           'KEY', 'LAG', 'LAST_VALUE', 'LASTNAME', 'LEAD', 'LEADING',
+                           'LEFT', 'LENGTH', 'LEVEL', 'LIKE', 'LIST', 'LN', 'LOG',
+                           'LOG10', 'LONG', 'LOWER', 'LPAD', 'MANUAL', 'MAPPING',
+                           'MATCHED', 'MATCHING', 'MAX', 'MAXVALUE', 'MERGE',
+                           'MILLISECOND', 'MIDDLENAME', 'MIN', 'MINUTE', 'MINVALUE',
+                           'MOD', 'MODULE_NAME', 'MONTH', 'NAMES', 'NATIONAL', 'NATURAL',
+                           'NCHAR', 'NO', 'NOT', 'NTH_VALUE', 'NULL', 'NUMERIC',
+                           'OCTET_LENGTH', 'OF', 'OFFSET', 'ON', 'ONLY', 'OPEN', 'OPTION',
+                           'OR', 'ORDER', 'OS_NAME', 'OUTER', 'OUTPUT_TYPE', 'OVER',
+                           'OVERFLOW', 'OVERLAY', 'PAGE', 'PAGES', 'PAGE_SIZE',
+                           'PARAMETER', 'PARTITION', 'PASSWORD', 'PI', 'PLACING', 'PLAN',
+                           'POSITION', 'POST_EVENT', 'POWER', 'PRECISION', 'PRIMARY',
+                           'PRIVILEGES', 'PROCEDURE', 'PROTECTED', 'RAND', 'RANK',
+                           'RDB$DB_KEY', 'RDB$RECORD_VERSION', 'READ', 'REAL',
+                           'RECORD_VERSION', 'RECREATE', 'RECURSIVE', 'REFERENCES',
+                           'REGR_AVGX', 'REGR_AVGY', 'REGR_COUNT', 'REGR_INTERCEPT',
+                           'REGR_R2', 'REGR_SLOPE', 'REGR_SXX', 'REGR_SXY', 'REGR_SYY',
+                           'RELEASE', 'REPLACE', 'RESERV', 'RESERVING', 'RETAIN',
+                           'RETURN', 'RETURNING_VALUES', 'RETURNS', 'REVERSE', 'REVOKE',
+                           'RIGHT', 'ROLLBACK', 'ROUND', 'ROW', 'ROW_COUNT', 'ROW_NUMBER',
+                           'ROWS', 'RPAD', 'SAVEPOINT', 'SCHEMA', 'SCROLL', 'SECOND',
+                           'SEGMENT', 'SELECT', 'SENSITIVE', 'SET', 'SHADOW', 'SHARED',
+                           'SIGN', 'SIMILAR', 'SIN', 'SINGULAR', 'SINH', 'SIZE',
+                           'SMALLINT', 'SNAPSHOT', 'SOME', 'SORT', 'SQLCODE', 'SQLSTATE',
+                           'SQRT', 'STABILITY', 'START', 'STARTING', 'STARTS',
+                           'STATISTICS', 'STDDEV_POP', 'STDDEV_SAMP', 'SUB_TYPE', 'SUM',
+                           'SUSPEND', 'TABLE', 'TAN', 'TANH', 'THEN', 'TIME', 'TIMESTAMP',
+                           'TO', 'TRAILING', 'TRANSACTION', 'TRIGGER', 'TRIM', 'TRUE',
+                           'TRUNC', 'TRUSTED', 'UNCOMMITTED', 'UNION', 'UNIQUE',
+                           'UNKNOWN', 'UPDATE', 'UPPER', 'USER', 'USING', 'UUID_TO_CHAR',
+                           'VALUE', 'VALUES', 'VAR_POP', 'VAR_SAMP', 'VARCHAR',
+                           'VARIABLE', 'VARYING', 'VIEW', 'WAIT', 'WEEK', 'WHEN', 'WHERE',
+                           'WHILE', 'WITH', 'WORK', 'WRITE', 'YEAR'])
+
+#: Reserved words in Firebird 4
+_RESERVED_FB4 = frozenset(['ADD', 'ADMIN', 'ALL', 'ALTER', 'AND', 'ANY', 'AS', 'AT',
+                           'AVG', 'BEGIN', 'BETWEEN', 'BIGINT', 'BINARY', 'BIT_LENGTH',
+                           'BLOB', 'BOOLEAN', 'BOTH', 'BY', 'CASE', 'CAST', 'CHAR',
+                           'CHAR_LENGTH', 'CHARACTER', 'CHARACTER_LENGTH', 'CHECK',
+                           'CLOSE', 'COLLATE', 'COLUMN', 'COMMENT', 'COMMIT', 'CONNECT',
+                           'CONSTRAINT', 'CORR', 'COUNT', 'COVAR_POP', 'COVAR_SAMP',
+                           'CREATE', 'CROSS', 'CURRENT', 'CURRENT_CONNECTION',
+                           'CURRENT_DATE', 'CURRENT_ROLE', 'CURRENT_TIME',
+                           'CURRENT_TIMESTAMP', 'CURRENT_TRANSACTION', 'CURRENT_USER',
+                           'CURSOR', 'DATE', 'DAY', 'DEC', 'DECFLOAT', 'DECIMAL',
+                           'DECLARE', 'DEFAULT', 'DELETE', 'DELETING', 'DETERMINISTIC',
+                           'DISCONNECT', 'DISTINCT', 'DOUBLE', 'DROP', 'ELSE', 'END',
+                           'ESCAPE', 'EXECUTE', 'EXISTS', 'EXTERNAL', 'EXTRACT', 'FALSE',
+                           'FETCH', 'FILTER', 'FLOAT', 'FOR', 'FOREIGN', 'FROM', 'FULL',
+                           'FUNCTION', 'GDSCODE', 'GLOBAL', 'GRANT', 'GROUP', 'HAVING',
+                           'HOUR', 'IN', 'INDEX', 'INNER', 'INSENSITIVE', 'INSERT',
+                           'INSERTING', 'INT', 'INT128', 'INTEGER', 'INTO', 'IS', 'JOIN',
+                           'LEADING', 'LEFT', 'LIKE', 'LATERAL', 'LOCAL', 'LOCALTIME',
+                           'LOCALTIMESTAMP', 'LONG', 'LOWER', 'MAX', 'MERGE', 'MIN',
+                           'MINUTE', 'MONTH', 'NATIONAL', 'NATURAL', 'NCHAR', 'NO', 'NOT',
+                           'NULL', 'NUMERIC', 'OCTET_LENGTH', 'OF', 'OFFSET', 'ON',
+                           'ONLY', 'OPEN', 'OR', 'ORDER', 'OUTER', 'OVER', 'PARAMETER',
+                           'PLAN', 'POSITION', 'POST_EVENT', 'PRECISION', 'PRIMARY',
+                           'PROCEDURE', 'PUBLICATION', 'RDB$DB_KEY', 'RDB$ERROR',
+                           'RDB$GET_CONTEXT', 'RDB$GET_TRANSACTION_CN',
+                           'RDB$RECORD_VERSION', 'RDB$ROLE_IN_USE', 'RDB$SET_CONTEXT',
+                           'RDB$SYSTEM_PRIVILEGE', 'REAL', 'RECORD_VERSION', 'RECREATE',
+                           'RECURSIVE', 'REFERENCES', 'REGR_AVGX', 'REGR_AVGY',
+                           'REGR_COUNT', 'REGR_INTERCEPT', 'REGR_R2', 'REGR_SLOPE',
+                           'REGR_SXX', 'REGR_SXY', 'REGR_SYY', 'RELEASE', 'RETURN',
+                           'RETURNING_VALUES', 'RETURNS', 'REVOKE', 'RIGHT', 'ROLLBACK',
+                           'ROW', 'ROW_COUNT', 'ROWS', 'SAVEPOINT', 'SCHEMA', 'SCROLL',
+                           'SECOND', 'SELECT', 'SENSITIVE', 'SET', 'SIMILAR', 'SMALLINT',
+                           'SOME', 'SQLCODE', 'SQLSTATE', 'START', 'STDDEV_POP',
+                           'STDDEV_SAMP', 'SUM', 'TABLE', 'THEN', 'TIME', 'TIMESTAMP',
+                           'TIMEZONE_HOUR', 'TIMEZONE_MINUTE', 'TO', 'TRAILING',
+                           'TRIGGER', 'TRIM', 'TRUE', 'UNBOUNDED', 'UNION', 'UNIQUE',
+                           'UNKNOWN', 'UPDATE', 'UPDATING', 'UPPER', 'USER', 'USING',
+                           'VALUE', 'VALUES', 'VAR_POP', 'VAR_SAMP', 'VARBINARY',
+                           'VARCHAR', 'VARIABLE', 'VARYING', 'VIEW', 'WHEN', 'WHERE',
+                           'WHILE', 'WINDOW', 'WITH', 'WITHOUT', 'YEAR'])
+
+#: Reserved words read from RDB$KEYWORDS (key = server version, Firebird 5+)
+_RESERVED_BY_VERSION: Dict[str, FrozenSet[str]] = {}
+
+#: Schema attributes that cache metadata of particular category
+_CATEGORY_ATTRS: Dict[Category, Tuple[str, ...]] = {
+    Category.TABLES: ('_Schema__tables',),
+    Category.VIEWS: ('_Schema__views',),
+    Category.DOMAINS: ('_Schema__domains', '_Schema__field_dimensions'),
+    Category.INDICES: ('_Schema__indices', '_Schema__constraint_indices', '_Schema__index_segments'),
+    Category.DEPENDENCIES: ('_Schema__dependencies', '_Schema__dependency_index'),
+    Category.GENERATORS: ('_Schema__generators',),
+    Category.TRIGGERS: ('_Schema__triggers',),
+    Category.PROCEDURES: ('_Schema__procedures',),
+    Category.CONSTRAINTS: ('_Schema__constraints',),
+    Category.COLLATIONS: ('_Schema__collations', '_Schema__collation_index',
+                          '_Schema__charset_collations'),
+    Category.CHARACTER_SETS: ('_Schema__character_sets', '_Schema__charset_index'),
+    Category.EXCEPTIONS: ('_Schema__exceptions',),
+    Category.ROLES: ('_Schema__roles',),
+    Category.FUNCTIONS: ('_Schema__functions',),
+    Category.FILES: ('_Schema__files',),
+    Category.SHADOWS: ('_Schema__shadows',),
+    Category.PRIVILEGES: ('_Schema__privileges', '_Schema__privilege_index'),
+    Category.USERS: ('_Schema__users', '_Schema__other_users'),
+    Category.PACKAGES: ('_Schema__packages',),
+    Category.BACKUP_HISTORY: ('_Schema__backup_history',),
+    Category.FILTERS: ('_Schema__filters',),
+    }
+
+# Metadata queries
+_SQL_DOMAINS = """select RDB$FIELD_NAME, RDB$VALIDATION_SOURCE, RDB$COMPUTED_SOURCE, RDB$DEFAULT_SOURCE,
+RDB$FIELD_LENGTH, RDB$FIELD_SCALE, RDB$FIELD_TYPE, RDB$FIELD_SUB_TYPE, RDB$DESCRIPTION,
+RDB$SYSTEM_FLAG, RDB$SEGMENT_LENGTH, RDB$EXTERNAL_LENGTH, RDB$EXTERNAL_SCALE,
+RDB$EXTERNAL_TYPE, RDB$DIMENSIONS, RDB$NULL_FLAG, RDB$CHARACTER_LENGTH,
+RDB$COLLATION_ID, RDB$CHARACTER_SET_ID, RDB$FIELD_PRECISION, RDB$SECURITY_CLASS,
+RDB$OWNER_NAME
+from RDB$FIELDS"""
+_SQL_GENERATORS = """select RDB$GENERATOR_NAME, RDB$GENERATOR_ID, RDB$DESCRIPTION, RDB$SYSTEM_FLAG,
+RDB$SECURITY_CLASS, RDB$OWNER_NAME, RDB$INITIAL_VALUE, RDB$GENERATOR_INCREMENT
+from rdb$generators"""
+_SQL_TRIGGERS = """select RDB$TRIGGER_NAME, RDB$RELATION_NAME, RDB$TRIGGER_SEQUENCE, RDB$TRIGGER_TYPE,
+RDB$TRIGGER_SOURCE, RDB$DESCRIPTION, RDB$TRIGGER_INACTIVE, RDB$SYSTEM_FLAG, RDB$FLAGS,
+RDB$VALID_BLR, RDB$ENGINE_NAME, RDB$ENTRYPOINT
+from RDB$TRIGGERS"""
+_SQL_PROCEDURES = """select RDB$PROCEDURE_NAME, RDB$PROCEDURE_ID, RDB$PROCEDURE_INPUTS,
+RDB$PROCEDURE_OUTPUTS, RDB$DESCRIPTION, RDB$PROCEDURE_SOURCE, RDB$SECURITY_CLASS,
+RDB$OWNER_NAME, RDB$SYSTEM_FLAG, RDB$PROCEDURE_TYPE, RDB$VALID_BLR, RDB$ENGINE_NAME,
+RDB$ENTRYPOINT, RDB$PACKAGE_NAME, RDB$PRIVATE_FLAG
+from rdb$procedures"""
+_SQL_FUNCTIONS = """select RDB$FUNCTION_NAME, RDB$FUNCTION_TYPE, RDB$DESCRIPTION, RDB$MODULE_NAME,
+RDB$ENTRYPOINT, RDB$RETURN_ARGUMENT, RDB$SYSTEM_FLAG, RDB$ENGINE_NAME, RDB$PACKAGE_NAME,
+RDB$PRIVATE_FLAG, RDB$FUNCTION_SOURCE, RDB$FUNCTION_ID, RDB$VALID_BLR,
+RDB$SECURITY_CLASS, RDB$OWNER_NAME, RDB$LEGACY_FLAG, RDB$DETERMINISTIC_FLAG
+from rdb$functions"""
+_SQL_FUNCTION_ARGUMENTS = """select RDB$FUNCTION_NAME, RDB$ARGUMENT_POSITION, RDB$MECHANISM,
+RDB$FIELD_TYPE, RDB$FIELD_SCALE, RDB$FIELD_LENGTH, RDB$FIELD_SUB_TYPE, RDB$CHARACTER_SET_ID,
+RDB$FIELD_PRECISION, RDB$CHARACTER_LENGTH, RDB$PACKAGE_NAME, RDB$ARGUMENT_NAME,
+RDB$FIELD_SOURCE, RDB$DEFAULT_SOURCE, RDB$COLLATION_ID, RDB$NULL_FLAG,
+RDB$ARGUMENT_MECHANISM, RDB$FIELD_NAME, RDB$RELATION_NAME, RDB$SYSTEM_FLAG, RDB$DESCRIPTION
+from rdb$function_arguments
+where rdb$function_name = ? order by rdb$argument_position"""
+# View BLR and runtime BLOBs are not needed, only whether relation is a view
+_SQL_RELATIONS = """select RDB$RELATION_NAME, RDB$RELATION_ID, RDB$RELATION_TYPE, RDB$SYSTEM_FLAG,
+RDB$DESCRIPTION, RDB$DBKEY_LENGTH, RDB$FORMAT, RDB$FLAGS, RDB$SECURITY_CLASS,
+RDB$DEFAULT_CLASS, RDB$OWNER_NAME, RDB$EXTERNAL_FILE, RDB$VIEW_SOURCE,
+iif(RDB$VIEW_BLR is null, 0, 1) as IS_VIEW
+from rdb$relations"""
+_SQL_CHARACTER_SETS = """select RDB$CHARACTER_SET_NAME, RDB$CHARACTER_SET_ID, RDB$DEFAULT_COLLATE_NAME,
+RDB$BYTES_PER_CHARACTER, RDB$SYSTEM_FLAG, RDB$DESCRIPTION, RDB$SECURITY_CLASS, RDB$OWNER_NAME
+from rdb$character_sets"""
+_SQL_ROLES = """select RDB$ROLE_NAME, RDB$OWNER_NAME, RDB$DESCRIPTION, RDB$SYSTEM_FLAG,
+RDB$SECURITY_CLASS
+from rdb$roles"""
+
+#: Schema collections searched by `Schema.get_item()` for individual object types
+_ITEM_COLLECTIONS: Dict[ObjectType, str] = {
+    ObjectType.TABLE: 'all_tables',
+    ObjectType.VIEW: 'all_views',
+    ObjectType.TRIGGER: 'all_triggers',
+    ObjectType.PROCEDURE: 'all_procedures',
+    ObjectType.INDEX: 'all_indices',
+    ObjectType.CHARACTER_SET: 'character_sets',
+    ObjectType.ROLE: 'roles',
+    ObjectType.GENERATOR: 'all_generators',
+    ObjectType.UDF: 'all_functions',
+    ObjectType.COLLATION: 'collations',
+    ObjectType.PACKAGE_HEADER: 'packages',
+    ObjectType.PACKAGE_BODY: 'packages',
+    }
+
+#: Loaders used by `Schema.prefetch()` for individual metadata categories
+_CATEGORY_LOADERS: Dict[Category, Any] = {
+    Category.TABLES: lambda s: s.all_tables,
+    Category.VIEWS: lambda s: s.all_views,
+    Category.DOMAINS: lambda s: s.all_domains,
+    Category.INDICES: lambda s: s.all_indices,
+    Category.DEPENDENCIES: lambda s: s.dependencies,
+    Category.GENERATORS: lambda s: s.all_generators,
+    Category.TRIGGERS: lambda s: s.all_triggers,
+    Category.PROCEDURES: lambda s: s.all_procedures,
+    Category.CONSTRAINTS: lambda s: s.constraints,
+    Category.COLLATIONS: lambda s: s.collations,
+    Category.CHARACTER_SETS: lambda s: s.character_sets,
+    Category.EXCEPTIONS: lambda s: s.exceptions,
+    Category.ROLES: lambda s: s.roles,
+    Category.FUNCTIONS: lambda s: s.all_functions,
+    Category.FILES: lambda s: s.files,
+    Category.SHADOWS: lambda s: s.shadows,
+    Category.PRIVILEGES: lambda s: s.privileges,
+    Category.USERS: lambda s: s._get_users(),
+    Category.PACKAGES: lambda s: s.packages,
+    Category.BACKUP_HISTORY: lambda s: s.backup_history,
+    Category.FILTERS: lambda s: s.filters,
+    }
+
+#: Metadata categories used by individual `Schema.get_metadata_ddl()` sections
+_SECTION_CATEGORIES: Dict[Section, Tuple[Category, ...]] = {
+    Section.COLLATIONS: (Category.COLLATIONS,),
+    Section.CHARACTER_SETS: (Category.CHARACTER_SETS, Category.COLLATIONS),
+    Section.UDFS: (Category.FUNCTIONS,),
+    Section.GENERATORS: (Category.GENERATORS,),
+    Section.EXCEPTIONS: (Category.EXCEPTIONS,),
+    Section.DOMAINS: (Category.DOMAINS,),
+    Section.PACKAGE_DEFS: (Category.PACKAGES,),
+    Section.FUNCTION_DEFS: (Category.FUNCTIONS, Category.DOMAINS),
+    Section.PROCEDURE_DEFS: (Category.PROCEDURES, Category.DOMAINS),
+    Section.TABLES: (Category.TABLES, Category.DOMAINS, Category.CONSTRAINTS,
+                     Category.INDICES),
+    Section.PRIMARY_KEYS: (Category.TABLES, Category.CONSTRAINTS, Category.INDICES),
+    Section.UNIQUE_CONSTRAINTS: (Category.TABLES, Category.CONSTRAINTS, Category.INDICES),
+    Section.CHECK_CONSTRAINTS: (Category.TABLES, Category.CONSTRAINTS, Category.TRIGGERS),
+    Section.FOREIGN_CONSTRAINTS: (Category.TABLES, Category.CONSTRAINTS, Category.INDICES),
+    Section.INDICES: (Category.TABLES, Category.INDICES),
+    Section.VIEWS: (Category.VIEWS, Category.DEPENDENCIES),
+    Section.PACKAGE_BODIES: (Category.PACKAGES,),
+    Section.PROCEDURE_BODIES: (Category.PROCEDURES, Category.DOMAINS),
+    Section.FUNCTION_BODIES: (Category.FUNCTIONS, Category.DOMAINS),
+    Section.TRIGGERS: (Category.TRIGGERS,),
+    Section.ROLES: (Category.ROLES,),
+    Section.GRANTS: (Category.PRIVILEGES, Category.TABLES, Category.VIEWS,
+                     Category.PROCEDURES, Category.ROLES),
+    Section.COMMENTS: (Category.CHARACTER_SETS, Category.COLLATIONS, Category.EXCEPTIONS,
+                       Category.DOMAINS, Category.GENERATORS, Category.TABLES,
+                       Category.INDICES, Category.VIEWS, Category.TRIGGERS,
+                       Category.PROCEDURES, Category.FUNCTIONS, Category.ROLES),
+    Section.SHADOWS: (Category.SHADOWS,),
+    Section.SET_GENERATORS: (Category.GENERATORS,),
+    Section.INDEX_DEACTIVATIONS: (Category.INDICES,),
+    Section.INDEX_ACTIVATIONS: (Category.INDICES,),
+    Section.TRIGGER_DEACTIVATIONS: (Category.TRIGGERS,),
+    Section.TRIGGER_ACTIVATIONS: (Category.TRIGGERS,),
+    }
 
 
 def get_grants(privileges: List[Privilege], grantors: List[str]=None) -> List[str]:
@@ -481,26 +776,21 @@ def get_grants(privileges: List[Privilege], grantors: List[str]=None) -> List[st
         grantors: List of standard grantor names. Generates GRANTED BY
             clause for privileges granted by user that's not in list.
     """
-    tp = set([PrivilegeCode.SELECT, PrivilegeCode.INSERT, PrivilegeCode.UPDATE,
-             PrivilegeCode.DELETE, PrivilegeCode.REFERENCES])
-
-    def skey(item):
-        return (item.user_name, item.user_type, item.grantor_name,
-                item.subject_name, item.subject_type, item.has_grant(),
-                item.privilege in tp, item.privilege.value, str(item.field_name),)
-    def gkey(item):
-        return (item.user_name, item.user_type, item.grantor_name,
-                item.subject_name, item.subject_type, item.has_grant(),
-                item.privilege in tp,)
-    def gkey2(item):
-        return item.privilege.name
+    tp = _TABLE_PRIVS
+    # Sort and group keys are computed only once for each privilege:
+    # (group key, privilege code, field name, privilege)
+    decorated = []
+    for item in privileges:
+        privilege = item.privilege
+        decorated.append(((item.user_name, item.user_type, item.grantor_name,
+                           item.subject_name, item.subject_type, item.has_grant(),
+                           privilege in tp), privilege.value, item.field_name or '', item))
+    decorated.sort(key=itemgetter(0, 1, 2))
 
     grants = []
-    p = list(privileges)
-    p.sort(key=skey)
-    for _, g in groupby(p, gkey):
+    for gkey, g in groupby(decorated, itemgetter(0)):
         g = list(g)
-        item = g[0]
+        item = g[0][3]
         if item.has_grant():
             admin_option = f" WITH {'ADMIN' if item.privilege is PrivilegeCode.MEMBERSHIP else 'GRANT'} OPTION"
         else:
@@ -520,36 +810,52 @@ def get_grants(privileges: List[Privilege], grantors: List[str]=None) -> List[st
             granted_by = f' GRANTED BY {item.grantor_name}'
         else:
             granted_by = ''
+        stype = item.subject_type
         priv_list = []
-        for _, items in groupby(g, gkey2):
-            items = list(items)
-            item = items[0]
-            if item.privilege in tp:
-                privilege = item.privilege.name
-                if len(items) > 1:
-                    privilege += f"({','.join(i.field_name for i in items if i.field_name)})"
-                elif item.field_name is not None:
-                    privilege += f'({item.field_name})'
-                priv_list.append(privilege)
-            elif item.privilege is PrivilegeCode.EXECUTE: # procedure
-                privilege = 'EXECUTE ON PROCEDURE '
-            elif item.privilege is PrivilegeCode.MEMBERSHIP:
-                privilege = ''
-        if priv_list:
-            privilege = ', '.join(priv_list)
-            privilege += ' ON '
-        grants.append(f'GRANT {privilege}{sname} TO {utype}{uname}{admin_option}{granted_by}')
+        for _, items in groupby(g, itemgetter(1)):
+            first = next(items)
+            privilege = first[3].privilege
+            if privilege in tp:
+                field_names = [fname for _, _, fname, _ in chain((first, ), items) if fname]
+                if field_names:
+                    priv_list.append(f"{privilege.name}({','.join(field_names)})")
+                else:
+                    priv_list.append(privilege.name)
+            elif privilege is PrivilegeCode.EXECUTE and stype in _EXECUTE_OBJECT_TYPES:
+                priv_list.append(f'EXECUTE ON {_EXECUTE_OBJECT_TYPES[stype]} {sname}')
+            elif privilege is PrivilegeCode.MEMBERSHIP:
+                priv_list.append(sname)
+            elif privilege is PrivilegeCode.USAGE and stype in _USAGE_OBJECT_TYPES:
+                priv_list.append(f'USAGE ON {_USAGE_OBJECT_TYPES[stype]} {sname}')
+            elif stype is ObjectType.DATABASE:
+                priv_list.append(f'{privilege.name} DATABASE')
+            elif stype in _DDL_OBJECT_TYPES:
+                any_ = '' if privilege is PrivilegeCode.CREATE else ' ANY'
+                priv_list.append(f'{privilege.name}{any_} {_DDL_OBJECT_TYPES[stype]}')
+            else:
+                raise Error(f"Unsupported privilege '{privilege.name}' on {stype.name} '{sname}'")
+        if gkey[6]:
+            # Table privileges are granted together
+            priv_list = [f"{', '.join(priv_list)} ON {sname}"]
+        for privilege in priv_list:
+            grants.append(f'GRANT {privilege} TO {utype}{uname}{admin_option}{granted_by}')
     return grants
 
 
 def escape_single_quotes(text: str) -> str:
     """Returns `text` with any single quotes escaped (doubled).
     """
-    return text.replace("'", "''")
+    return text.replace("'", "''") if "'" in text else text
+
+def _sql_string_lit(text: Optional[str]) -> str:
+    """Returns `text` as quoted SQL string literal, or `NULL` when `text` is None.
+    """
+    return 'NULL' if text is None else f"'{escape_single_quotes(text)}'"
 
 class Visitable:
     """Base class for Visitor Pattern support.
     """
+    __slots__ = ()
     def accept(self, visitor: Visitor) -> None:
         """Visitor Pattern support.
 
@@ -601,6 +907,7 @@ class Visitor:
        visit_b B
        visit_b C
     """
+    __slots__ = ()
     def visit(self, obj: Visitable) -> Any:
         """Dispatch to method that handles `obj`.
 
@@ -689,33 +996,17 @@ class Schema(Visitable):
     def __init__(self):
         self._con: Connection = None
         self._ic: Cursor = None
+        # Weak proxy passed to owned schema items, created once for all of them
+        self._self_proxy: Schema = weakref.proxy(self)
         self.__internal: bool = False
+        self.__statements: Dict[str, Statement] = {}
         # Engine/ODS specific data
-        self._reserved_: List[str] = []
+        self._reserved_: FrozenSet[str] = frozenset()
+        # Quoted form of identifiers, depends on reserved words (see SchemaItem._get_quoted_ident)
+        self._quoted_idents: Dict[str, str] = {}
         self.ods: float = None
-        # database metadata
-        self.__tables: Tuple[DataList, DataList] = None
-        self.__views: Tuple[DataList, DataList] = None
-        self.__domains: Tuple[DataList, DataList] = None
-        self.__indices: Tuple[DataList, DataList] = None
-        self.__constraint_indices = None
-        self.__dependencies: DataList = None
-        self.__generators: Tuple[DataList, DataList] = None
-        self.__triggers: Tuple[DataList, DataList] = None
-        self.__procedures: Tuple[DataList, DataList] = None
-        self.__constraints: DataList = None
-        self.__collations: DataList = None
-        self.__character_sets: DataList = None
-        self.__exceptions: DataList = None
-        self.__roles: DataList = None
-        self.__functions: Tuple[DataList, DataList] = None
-        self.__files: DataList = None
-        self.__shadows: DataList = None
-        self.__privileges: DataList = None
-        self.__users: DataList = None
-        self.__packages: DataList = None
-        self.__backup_history: DataList = None
-        self.__filters: DataList = None
+        # database metadata (see _CATEGORY_ATTRS)
+        self.__clear()
         self.__attrs = None
         self._default_charset_name = None
         self.__owner = None
@@ -732,8 +1023,13 @@ class Schema(Visitable):
     def _close(self) -> None:
         if self._ic is not None:
             self._ic.close()
+        self.__free_statements()
         self._con = None
         self._ic = None
+    def __free_statements(self) -> None:
+        for stmt in self.__statements.values():
+            stmt.free()
+        self.__statements.clear()
     def _set_internal(self, value: bool) -> None:
         self.__internal = value
     def __clear(self, data: Union[Category, List[Category], Tuple]=None) -> None:
@@ -741,186 +1037,176 @@ class Schema(Visitable):
             if not isinstance(data, (list, tuple)):
                 data = (data, )
         else:
-            data = list(Category)
+            data = _CATEGORY_ATTRS
         for item in data:
-            if item is Category.TABLES:
-                self.__tables: Tuple[DataList, DataList] = None
-            elif item is Category.VIEWS:
-                self.__views: Tuple[DataList, DataList] = None
-            elif item is Category.DOMAINS:
-                self.__domains: Tuple[DataList, DataList] = None
-            elif item is Category.INDICES:
-                self.__indices: Tuple[DataList, DataList] = None
-                self.__constraint_indices = None
-            elif item is Category.DEPENDENCIES:
-                self.__dependencies: DataList = None
-            elif item is Category.GENERATORS:
-                self.__generators: Tuple[DataList, DataList] = None
-            elif item is Category.TRIGGERS:
-                self.__triggers: Tuple[DataList, DataList] = None
-            elif item is Category.PROCEDURES:
-                self.__procedures: Tuple[DataList, DataList] = None
-            elif item is Category.CONSTRAINTS:
-                self.__constraints: DataList = None
-            elif item is Category.COLLATIONS:
-                self.__collations: DataList = None
-            elif item is Category.CHARACTER_SETS:
-                self.__character_sets: DataList = None
-            elif item is Category.EXCEPTIONS:
-                self.__exceptions: DataList = None
-            elif item is Category.ROLES:
-                self.__roles: DataList = None
-            elif item is Category.FUNCTIONS:
-                self.__functions: Tuple[DataList, DataList] = None
-            elif item is Category.FILES:
-                self.__files: DataList = None
-            elif item is Category.SHADOWS:
-                self.__shadows: DataList = None
-            elif item is Category.PRIVILEGES:
-                self.__privileges: DataList = None
-            elif item is Category.USERS:
-                self.__users: DataList = None
-            elif item is Category.PACKAGES:
-                self.__packages: DataList = None
-            elif item is Category.BACKUP_HISTORY:
-                self.__backup_history: DataList = None
-            elif item is Category.FILTERS:
-                self.__filters: DataList = None
+            for attr in _CATEGORY_ATTRS.get(item, ()):
+                setattr(self, attr, None)
     def _select_row(self, cmd: Union[Statement, str], params: List=None) -> Dict[str, Any]:
         self._ic.execute(cmd, params)
         row = self._ic.fetchone()
-        return {self._ic.description[i][0]: row[i] for i in range(len(row))}
-    def _select(self, cmd: str, params: List=None) -> Dict[str, Any]:
+        return dict(zip([sys.intern(d[0]) for d in self._ic.description], row))
+    def _prepare(self, cmd: str) -> Union[Statement, str]:
+        # Metadata queries are prepared only once and reused on reload. Queries over
+        # the limit are returned as is, so they're prepared on each execution.
+        if (stmt := self.__statements.get(cmd)) is None:
+            if len(self.__statements) >= _MAX_PREPARED_STATEMENTS:
+                return cmd
+            stmt = self.__statements[cmd] = self._ic.prepare(cmd)
+        return stmt
+    def _select(self, cmd: Union[Statement, str], params: List=None) -> List[Dict[str, Any]]:
+        # All rows are fetched at once, so callers could run other queries on internal
+        # cursor while they process returned rows.
         self._ic.execute(cmd, params)
-        desc = self._ic.description
-        return ({desc[i][0]: row[i] for i in range(len(row))} for row in self._ic)
-    def _get_field_dimensions(self, field) -> List[Tuple[int, int]]:
-        return [(r[0], r[1]) for r in
-                self._ic.execute(f"""select RDB$LOWER_BOUND, RDB$UPPER_BOUND
-                from RDB$FIELD_DIMENSIONS where RDB$FIELD_NAME = '{field.name}' order by RDB$DIMENSION""")]
+        keys = [sys.intern(d[0]) for d in self._ic.description]
+        return [dict(zip(keys, row)) for row in self._ic.fetchall()]
+    def _get_field_dimensions(self, field: Domain) -> List[Tuple[int, int]]:
+        if self.__field_dimensions is None:
+            self.__fail_if_closed()
+            self.__field_dimensions = {}
+            for name, lower, upper in self._ic.execute("""select RDB$FIELD_NAME,
+            RDB$LOWER_BOUND, RDB$UPPER_BOUND from RDB$FIELD_DIMENSIONS
+            order by RDB$FIELD_NAME, RDB$DIMENSION"""):
+                self.__field_dimensions.setdefault(name.strip(), []).append((lower, upper))
+        return list(self.__field_dimensions.get(field.name, []))
+    def __split(self, items: List[SchemaItem], item_type: type) -> Tuple[DataList, DataList, DataList]:
+        # Returns frozen (user, system, all) lists. Items are classified in single pass.
+        user_items = []
+        sys_items = []
+        for item in items:
+            (sys_items if item.is_sys_object() else user_items).append(item)
+        return (DataList(user_items, item_type, 'item.name', frozen=True),
+                DataList(sys_items, item_type, 'item.name', frozen=True),
+                DataList(items, item_type, 'item.name', frozen=True))
     def _get_all_domains(self) -> Tuple[DataList[Domain], DataList[Domain], DataList[Domain]]:
         if self.__domains is None:
             self.__fail_if_closed()
-            cols = ['RDB$FIELD_NAME', 'RDB$VALIDATION_SOURCE', 'RDB$COMPUTED_SOURCE',
-                    'RDB$DEFAULT_SOURCE', 'RDB$FIELD_LENGTH', 'RDB$FIELD_SCALE',
-                    'RDB$FIELD_TYPE', 'RDB$FIELD_SUB_TYPE', 'RDB$DESCRIPTION',
-                    'RDB$SYSTEM_FLAG', 'RDB$SEGMENT_LENGTH', 'RDB$EXTERNAL_LENGTH',
-                    'RDB$EXTERNAL_SCALE', 'RDB$EXTERNAL_TYPE', 'RDB$DIMENSIONS',
-                    'RDB$NULL_FLAG', 'RDB$CHARACTER_LENGTH', 'RDB$COLLATION_ID',
-                    'RDB$CHARACTER_SET_ID', 'RDB$FIELD_PRECISION', 'RDB$SECURITY_CLASS',
-                    'RDB$OWNER_NAME']
-            domains = DataList((Domain(self, row) for row
-                                in self._select(f"select {','.join(cols)} from RDB$FIELDS")),
-                               Domain, 'item.name', frozen=True)
-            sys_domains, user_domains = domains.split(lambda i: i.is_sys_object(), frozen=True)
-            self.__domains = (user_domains, sys_domains, domains)
+            self.__domains = self.__split([Domain(self._self_proxy, row) for row
+                                           in self._select(self._prepare(_SQL_DOMAINS))], Domain)
         return self.__domains
+    def __load_relations(self) -> None:
+        # Tables and views are loaded from single scan of RDB$RELATIONS. Only categories
+        # that are not already loaded are (re)created.
+        self.__fail_if_closed()
+        load_tables = self.__tables is None
+        load_views = self.__views is None
+        tables = []
+        views = []
+        for row in self._select(self._prepare(_SQL_RELATIONS)):
+            if not row.pop('IS_VIEW'):
+                if load_tables:
+                    tables.append(Table(self._self_proxy, row))
+            elif load_views:
+                views.append(View(self._self_proxy, row))
+        if load_tables:
+            self.__tables = self.__split(tables, Table)
+        if load_views:
+            self.__views = self.__split(views, View)
     def _get_all_tables(self) -> Tuple[DataList[Table], DataList[Table], DataList[Table]]:
         if self.__tables is None:
-            self.__fail_if_closed()
-            tables = DataList((Table(self, row) for row
-                               in self._select('select * from rdb$relations where rdb$view_blr is null')),
-                              Table, 'item.name', frozen=True)
-            sys_tables, user_tables = tables.split(lambda i: i.is_sys_object(), frozen=True)
-            self.__tables = (user_tables, sys_tables, tables)
+            self.__load_relations()
         return self.__tables
     def _get_all_views(self) -> Tuple[DataList[View], DataList[View], DataList[View]]:
         if self.__views is None:
-            self.__fail_if_closed()
-            views = DataList((View(self, row) for row
-                              in self._select('select * from rdb$relations where rdb$view_blr is not null')),
-                             View, 'item.name', frozen=True)
-            sys_views, user_views = views.split(lambda i: i.is_sys_object(), frozen=True)
-            self.__views = (user_views, sys_views, views)
+            self.__load_relations()
         return self.__views
     def _get_constraint_indices(self) -> Dict[str, str]:
         if self.__constraint_indices is None:
             self.__fail_if_closed()
-            self._ic.execute("""select RDB$INDEX_NAME, RDB$CONSTRAINT_NAME
-            from RDB$RELATION_CONSTRAINTS where RDB$INDEX_NAME is not null""")
-            self.__constraint_indices = {key.strip(): value.strip() for key, value
-                                         in self._ic}
+            rows = self._ic.execute(self._prepare("""select RDB$INDEX_NAME, RDB$CONSTRAINT_NAME
+            from RDB$RELATION_CONSTRAINTS where RDB$INDEX_NAME is not null""")).fetchall()
+            self.__constraint_indices = {key.strip(): value.strip() for key, value in rows}
         return self.__constraint_indices
     def _get_all_indices(self) -> Tuple[DataList[Index], DataList[Index], DataList[Index]]:
         if self.__indices is None:
             self.__fail_if_closed()
-            # Dummy call to _get_constraint_indices() is necessary as
-            # Index.is_sys_object() that is called in Index.__init__() will
-            # drop result from internal cursor and we'll not load all indices.
-            self._get_constraint_indices()
-            ext = '' if self.ods <= 13.0 else  ', RDB$CONDITION_SOURCE'
-            cmd = f"""select RDB$INDEX_NAME, RDB$RELATION_NAME, RDB$INDEX_ID,
-            RDB$UNIQUE_FLAG, RDB$DESCRIPTION, RDB$SEGMENT_COUNT, RDB$INDEX_INACTIVE,
-            RDB$INDEX_TYPE, RDB$FOREIGN_KEY, RDB$SYSTEM_FLAG, RDB$EXPRESSION_SOURCE,
-            RDB$STATISTICS{ext} from RDB$INDICES"""
-            indices = DataList((Index(self, row) for row in self._select(cmd)),
-                               Index, 'item.name', frozen=True)
-            sys_indices, user_indices = indices.split(lambda i: i.is_sys_object(), frozen=True)
-            self.__indices = (user_indices, sys_indices, indices)
+            # Constraint names are fetched together with indices, because
+            # Index.is_sys_object() called in Index.__init__() needs them.
+            ext = '' if self.ods <= 13.0 else  ', i.RDB$CONDITION_SOURCE'
+            cmd = f"""select i.RDB$INDEX_NAME, i.RDB$RELATION_NAME, i.RDB$INDEX_ID,
+            i.RDB$UNIQUE_FLAG, i.RDB$DESCRIPTION, i.RDB$SEGMENT_COUNT, i.RDB$INDEX_INACTIVE,
+            i.RDB$INDEX_TYPE, i.RDB$FOREIGN_KEY, i.RDB$SYSTEM_FLAG, i.RDB$EXPRESSION_SOURCE,
+            i.RDB$STATISTICS{ext}, c.RDB$CONSTRAINT_NAME as CONSTRAINT_NAME
+            from RDB$INDICES i left join RDB$RELATION_CONSTRAINTS c
+            on i.RDB$INDEX_NAME = c.RDB$INDEX_NAME"""
+            rows = self._select(self._prepare(cmd))
+            constraint_indices = {}
+            for row in rows:
+                if (cname := row.pop('CONSTRAINT_NAME')) is not None:
+                    constraint_indices[row['RDB$INDEX_NAME'].strip()] = cname.strip()
+            self.__constraint_indices = constraint_indices
+            self.__indices = self.__split([Index(self._self_proxy, row) for row in rows], Index)
         return self.__indices
     def _get_all_generators(self) -> Tuple[DataList[Sequence], DataList[Sequence], DataList[Sequence]]:
         if self.__generators is None:
             self.__fail_if_closed()
-            cols = ['RDB$GENERATOR_NAME', 'RDB$GENERATOR_ID', 'RDB$DESCRIPTION',
-                    'RDB$SYSTEM_FLAG', 'RDB$SECURITY_CLASS', 'RDB$OWNER_NAME',
-                    'RDB$INITIAL_VALUE', 'RDB$GENERATOR_INCREMENT']
-            generators = DataList((Sequence(self, row) for row
-                                   in self._select(f"select {','.join(cols)} from rdb$generators")),
-                                  Sequence, 'item.name', frozen=True)
-            sys_generators, user_generators = generators.split(lambda i: i.is_sys_object(),
-                                                               frozen=True)
-            self.__generators = (user_generators, sys_generators, generators)
+            self.__generators = self.__split([Sequence(self._self_proxy, row) for row
+                                              in self._select(self._prepare(_SQL_GENERATORS))], Sequence)
         return self.__generators
     def _get_all_triggers(self) -> Tuple[DataList[Trigger], DataList[Trigger], DataList[Trigger]]:
         if self.__triggers is None:
             self.__fail_if_closed()
-            cols = ['RDB$TRIGGER_NAME', 'RDB$RELATION_NAME', 'RDB$TRIGGER_SEQUENCE',
-                    'RDB$TRIGGER_TYPE', 'RDB$TRIGGER_SOURCE', 'RDB$DESCRIPTION',
-                    'RDB$TRIGGER_INACTIVE', 'RDB$SYSTEM_FLAG', 'RDB$FLAGS',
-                    'RDB$VALID_BLR', 'RDB$ENGINE_NAME', 'RDB$ENTRYPOINT']
-            triggers = DataList((Trigger(self, row) for row
-                                 in self._select(f"select {','.join(cols)} from RDB$TRIGGERS")),
-                                Trigger, 'item.name', frozen=True)
-            sys_triggers, user_triggers = triggers.split(lambda i: i.is_sys_object(), frozen=True)
-            self.__triggers = (user_triggers, sys_triggers, triggers)
+            self.__triggers = self.__split([Trigger(self._self_proxy, row) for row
+                                            in self._select(self._prepare(_SQL_TRIGGERS))], Trigger)
         return self.__triggers
     def _get_all_procedures(self) -> Tuple[DataList[Procedure], DataList[Procedure], DataList[Procedure]]:
         if self.__procedures is None:
             self.__fail_if_closed()
-            cols = ['RDB$PROCEDURE_NAME', 'RDB$PROCEDURE_ID', 'RDB$PROCEDURE_INPUTS',
-                    'RDB$PROCEDURE_OUTPUTS', 'RDB$DESCRIPTION', 'RDB$PROCEDURE_SOURCE',
-                    'RDB$SECURITY_CLASS', 'RDB$OWNER_NAME', 'RDB$SYSTEM_FLAG',
-                    'RDB$PROCEDURE_TYPE', 'RDB$VALID_BLR', 'RDB$ENGINE_NAME',
-                    'RDB$ENTRYPOINT', 'RDB$PACKAGE_NAME', 'RDB$PRIVATE_FLAG']
-            procedures = DataList((Procedure(self, row) for row
-                                   in self._select(f"select {','.join(cols)} from rdb$procedures")),
-                                  Procedure, 'item.name', frozen=True)
-            sys_procedures, user_procedures = procedures.split(lambda i: i.is_sys_object(),
-                                                               frozen=True)
-            self.__procedures = (user_procedures, sys_procedures, procedures)
+            self.__procedures = self.__split([Procedure(self._self_proxy, row) for row
+                                              in self._select(self._prepare(_SQL_PROCEDURES))], Procedure)
         return self.__procedures
     def _get_all_functions(self) -> Tuple[DataList[Function], DataList[Function], DataList[Function]]:
         if self.__functions is None:
             self.__fail_if_closed()
-            cols = ['RDB$FUNCTION_NAME', 'RDB$FUNCTION_TYPE', 'RDB$DESCRIPTION',
-                    'RDB$MODULE_NAME', 'RDB$ENTRYPOINT', 'RDB$RETURN_ARGUMENT',
-                    'RDB$SYSTEM_FLAG', 'RDB$ENGINE_NAME', 'RDB$PACKAGE_NAME',
-                    'RDB$PRIVATE_FLAG', 'RDB$FUNCTION_SOURCE', 'RDB$FUNCTION_ID',
-                    'RDB$VALID_BLR', 'RDB$SECURITY_CLASS', 'RDB$OWNER_NAME',
-                    'RDB$LEGACY_FLAG', 'RDB$DETERMINISTIC_FLAG']
-            functions = DataList((Function(self, row) for row
-                                  in self._select(f"select {','.join(cols)} from rdb$functions")),
-                                 Function, 'item.name', frozen=True)
-            sys_functions, user_functions = functions.split(lambda i: i.is_sys_object(),
-                                                            frozen=True)
-            self.__functions = (user_functions, sys_functions, functions)
+            self.__functions = self.__split([Function(self._self_proxy, row) for row
+                                             in self._select(self._prepare(_SQL_FUNCTIONS))], Function)
         return self.__functions
+    def _get_dependency_index(self) -> Tuple[Dict[str, List[Dependency]],
+                                             Dict[str, List[Dependency]]]:
+        # Dependencies grouped by names of depended on and dependent objects
+        if self.__dependency_index is None:
+            depended_on = {}
+            dependent = {}
+            for dep in self.dependencies:
+                depended_on.setdefault(dep.depended_on_name, []).append(dep)
+                dependent.setdefault(dep.dependent_name, []).append(dep)
+            self.__dependency_index = (depended_on, dependent)
+        return self.__dependency_index
+    def _get_index_segments(self) -> Dict[str, List[Tuple[str, float]]]:
+        # Segments (field name, statistics) of all indices, by index name
+        if self.__index_segments is None:
+            self.__fail_if_closed()
+            self.__index_segments = {}
+            for index_name, field_name, statistics in self._ic.execute("""select RDB$INDEX_NAME,
+            RDB$FIELD_NAME, RDB$STATISTICS from RDB$INDEX_SEGMENTS
+            order by RDB$INDEX_NAME, RDB$FIELD_POSITION"""):
+                self.__index_segments.setdefault(index_name.strip(), []).append((field_name.strip(), statistics))
+        return self.__index_segments
+    def _get_charset_collations(self) -> Dict[int, DataList[Collation]]:
+        # Collations grouped by character set ID
+        if self.__charset_collations is None:
+            groups = {}
+            for collation in self.collations:
+                groups.setdefault(collation._attributes['RDB$CHARACTER_SET_ID'], []).append(collation)
+            self.__charset_collations = {charset_id: DataList(items, Collation, 'item.name', frozen=True)
+                                         for charset_id, items in groups.items()}
+        return self.__charset_collations
+    def _get_privilege_index(self) -> Tuple[Dict[str, List[Privilege]],
+                                            Dict[str, List[Privilege]]]:
+        # Privileges grouped by user (grantee) and subject names
+        if self.__privilege_index is None:
+            by_user = {}
+            by_subject = {}
+            for priv in self.privileges:
+                by_user.setdefault(priv.user_name, []).append(priv)
+                by_subject.setdefault(priv.subject_name, []).append(priv)
+            self.__privilege_index = (by_user, by_subject)
+        return self.__privilege_index
     def _get_users(self) -> DataList[UserInfo]:
         if self.__users is None:
             self.__fail_if_closed()
-            self._ic.execute('select distinct(RDB$USER) FROM RDB$USER_PRIVILEGES')
-            self.__users = DataList((UserInfo(user_name=row[0].strip()) for row in self._ic),
-                                    UserInfo, 'item.user_name')
+            rows = self._ic.execute(self._prepare('select distinct(RDB$USER) FROM RDB$USER_PRIVILEGES')).fetchall()
+            self.__users = DataList([UserInfo(user_name=row[0].strip()) for row in rows],
+                                    UserInfo, 'item.user_name', frozen=True)
         return self.__users
     def bind(self, connection: Connection) -> Schema:
         """Bind this instance to specified connection`.
@@ -930,138 +1216,54 @@ class Schema(Visitable):
         """
         if self.__internal:
             raise Error("Call to 'bind' not allowed for embedded Schema.")
+        if self._ic is not None:
+            self._ic.close()
+        self.__free_statements()
         self._con = connection
         self._ic = self._con.transaction_manager(tpb(Isolation.READ_COMMITTED_RECORD_VERSION,
                                                      access_mode=TraAccessMode.READ)).cursor()
         self._ic._logging_id_ = 'schema.internal_cursor'
         self.__clear()
+        self._quoted_idents.clear()
         self.ods = self._con.info.ods
         if self.ods == 12.0: # Firebird 3
-            self._reserved_ = ['ABS', 'ACOS', 'ACOSH', 'ACTIVE', 'ADD', 'ADMIN', 'AFTER',
-                               'ALL', 'ALTER', 'AND', 'ANY', 'AS', 'ASC', 'ASCENDING',
-                               'ASCII_CHAR', 'ASCII_VAL', 'ASIN', 'ASINH', 'AT', 'ATAN',
-                               'ATAN2', 'ATANH', 'AUTO', 'AUTONOMOUS', 'AVG', 'BEFORE',
-                               'BEGIN', 'BETWEEN', 'BIGINT', 'BIN_AND', 'BIN_NOT', 'BIN_OR',
-                               'BIN_SHL', 'BIN_SHR', 'BIN_XOR', 'BIT_LENGTH', 'BLOB',
-                               'BOOLEAN', 'BOTH', 'BY', 'CASE', 'CAST', 'CEIL', 'CEILING',
-                               'CHAR', 'CHAR_LENGTH', 'CHAR_TO_UUID', 'CHARACTER',
-                               'CHARACTER_LENGTH', 'CHECK', 'CLOSE', 'COLLATE', 'COLUMN',
-                               'COMMIT', 'COMMITTED', 'COMPUTED', 'CONDITIONAL', 'CONNECT',
-                               'CONSTRAINT', 'CONTAINING', 'CORR', 'COS', 'COSH', 'COT',
-                               'COUNT', 'COVAR_POP', 'COVAR_SAMP', 'CREATE', 'CROSS',
-                               'CSTRING', 'CURRENT', 'CURRENT_CONNECTION', 'CURRENT_DATE',
-                               'CURRENT_ROLE', 'CURRENT_TIME', 'CURRENT_TIMESTAMP',
-                               'CURRENT_TRANSACTION', 'CURRENT_USER', 'CURSOR', 'DATABASE',
-                               'DATE', 'DATEADD', 'DATEDIFF', 'DAY', 'DDL', 'DEC',
-                               'DECIMAL', 'DECLARE', 'DECODE', 'DEFAULT', 'DELETE',
-                               'DENSE_RANK', 'DESC', 'DESCENDING', 'DETERMINISTIC',
-                               'DISCONNECT', 'DISTINCT', 'DO', 'DOMAIN', 'DOUBLE', 'DROP',
-                               'ELSE', 'END', 'ENTRY_POINT', 'ESCAPE', 'EXCEPTION',
-                               'EXECUTE', 'EXISTS', 'EXIT', 'EXP', 'EXTERNAL', 'EXTRACT',
-                               'FALSE', 'FETCH', 'FILE', 'FILTER', 'FIRST_VALUE',
-                               'FIRSTNAME', 'FLOAT', 'FLOOR', 'FOR', 'FOREIGN', 'FROM',
-                               'FULL', 'FUNCTION', 'GDSCODE', 'GENERATOR', 'GEN_ID',
-                               'GEN_UUID', 'GLOBAL', 'GRANT', 'GRANTED', 'GROUP', 'HASH',
-                               'HAVING', 'HOUR', 'IDENTITY', 'IF', 'IN', 'INACTIVE',
-                               'INCREMENT', 'INDEX', 'INNER', 'INPUT_TYPE', 'INSENSITIVE',
-                               'INSERT', 'INT', 'INTEGER', 'INTO', 'IS', 'ISOLATION',
-                               'JOIN', 'KEY', 'LAG', 'LAST_VALUE', 'LASTNAME', 'LEAD',
-                               'LEADING', 'LEFT', 'LENGTH', 'LEVEL', 'LIKE', 'LIST', 'LN',
-                               'LOG', 'LOG10', 'LONG', 'LOWER', 'LPAD', 'MANUAL',
-                               'MAPPING', 'MATCHED', 'MATCHING', 'MAX', 'MAXVALUE',
-                               'MERGE', 'MILLISECOND', 'MIDDLENAME', 'MIN', 'MINUTE',
-                               'MINVALUE', 'MOD', 'MODULE_NAME', 'MONTH', 'NAMES',
-                               'NATIONAL', 'NATURAL', 'NCHAR', 'NO', 'NOT', 'NTH_VALUE',
-                               'NULL', 'NUMERIC', 'OCTET_LENGTH', 'OF', 'OFFSET', 'ON',
-                               'ONLY', 'OPEN', 'OPTION', 'OR', 'ORDER', 'OS_NAME', 'OUTER',
-                               'OUTPUT_TYPE', 'OVER', 'OVERFLOW', 'OVERLAY', 'PAGE',
-                               'PAGES', 'PAGE_SIZE', 'PARAMETER', 'PARTITION', 'PASSWORD',
-                               'PI', 'PLACING', 'PLAN', 'POSITION', 'POST_EVENT', 'POWER',
-                               'PRECISION', 'PRIMARY', 'PRIVILEGES', 'PROCEDURE',
-                               'PROTECTED', 'RAND', 'RANK', 'RDB$DB_KEY',
-                               'RDB$RECORD_VERSION', 'READ', 'REAL', 'RECORD_VERSION',
-                               'RECREATE', 'RECURSIVE', 'REFERENCES', 'REGR_AVGX',
-                               'REGR_AVGY', 'REGR_COUNT', 'REGR_INTERCEPT', 'REGR_R2',
-                               'REGR_SLOPE', 'REGR_SXX', 'REGR_SXY', 'REGR_SYY', 'RELEASE',
-                               'REPLACE', 'RESERV', 'RESERVING', 'RETAIN', 'RETURN',
-                               'RETURNING_VALUES', 'RETURNS', 'REVERSE', 'REVOKE', 'RIGHT',
-                               'ROLLBACK', 'ROUND', 'ROW', 'ROW_COUNT', 'ROW_NUMBER',
-                               'ROWS', 'RPAD', 'SAVEPOINT', 'SCHEMA', 'SCROLL', 'SECOND',
-                               'SEGMENT', 'SELECT', 'SENSITIVE', 'SET', 'SHADOW', 'SHARED',
-                               'SIGN', 'SIMILAR', 'SIN', 'SINGULAR', 'SINH', 'SIZE',
-                               'SMALLINT', 'SNAPSHOT', 'SOME', 'SORT', 'SQLCODE',
-                               'SQLSTATE', 'SQRT', 'STABILITY', 'START', 'STARTING',
-                               'STARTS', 'STATISTICS', 'STDDEV_POP', 'STDDEV_SAMP',
-                               'SUB_TYPE', 'SUM', 'SUSPEND', 'TABLE', 'TAN', 'TANH',
-                               'THEN', 'TIME', 'TIMESTAMP', 'TO', 'TRAILING',
-                               'TRANSACTION', 'TRIGGER', 'TRIM', 'TRUE', 'TRUNC',
-                               'TRUSTED', 'UNCOMMITTED', 'UNION', 'UNIQUE', 'UNKNOWN',
-                               'UPDATE', 'UPPER', 'USER', 'USING', 'UUID_TO_CHAR', 'VALUE',
-                               'VALUES', 'VAR_POP', 'VAR_SAMP', 'VARCHAR', 'VARIABLE',
-                               'VARYING', 'VIEW', 'WAIT', 'WEEK', 'WHEN', 'WHERE', 'WHILE',
-                               'WITH', 'WORK', 'WRITE', 'YEAR']
+            self._reserved_ = _RESERVED_FB3
         elif self.ods == 13.0: # Firebird 4
-            self._reserved_ = ['ADD', 'ADMIN', 'ALL', 'ALTER', 'AND', 'ANY', 'AS', 'AT',
-                               'AVG', 'BEGIN', 'BETWEEN', 'BIGINT', 'BINARY', 'BIT_LENGTH',
-                               'BLOB', 'BOOLEAN', 'BOTH', 'BY', 'CASE', 'CAST', 'CHAR',
-                               'CHAR_LENGTH', 'CHARACTER', 'CHARACTER_LENGTH', 'CHECK',
-                               'CLOSE', 'COLLATE', 'COLUMN', 'COMMENT', 'COMMIT',
-                               'CONNECT', 'CONSTRAINT', 'CORR', 'COUNT', 'COVAR_POP',
-                               'COVAR_SAMP', 'CREATE', 'CROSS', 'CURRENT',
-                               'CURRENT_CONNECTION', 'CURRENT_DATE', 'CURRENT_ROLE',
-                               'CURRENT_TIME', 'CURRENT_TIMESTAMP', 'CURRENT_TRANSACTION',
-                               'CURRENT_USER', 'CURSOR', 'DATE', 'DAY', 'DEC', 'DECFLOAT',
-                               'DECIMAL', 'DECLARE', 'DEFAULT', 'DELETE', 'DELETING',
-                               'DETERMINISTIC', 'DISCONNECT', 'DISTINCT', 'DOUBLE', 'DROP',
-                               'ELSE', 'END', 'ESCAPE', 'EXECUTE', 'EXISTS', 'EXTERNAL',
-                               'EXTRACT', 'FALSE', 'FETCH', 'FILTER', 'FLOAT', 'FOR',
-                               'FOREIGN', 'FROM', 'FULL', 'FUNCTION', 'GDSCODE', 'GLOBAL',
-                               'GRANT', 'GROUP', 'HAVING', 'HOUR', 'IN', 'INDEX', 'INNER',
-                               'INSENSITIVE', 'INSERT', 'INSERTING', 'INT', 'INT128',
-                               'INTEGER', 'INTO', 'IS', 'JOIN', 'LEADING', 'LEFT', 'LIKE',
-                               'LATERAL', 'LOCAL', 'LOCALTIME', 'LOCALTIMESTAMP', 'LONG',
-                               'LOWER', 'MAX', 'MERGE', 'MIN', 'MINUTE', 'MONTH',
-                               'NATIONAL', 'NATURAL', 'NCHAR', 'NO', 'NOT', 'NULL',
-                               'NUMERIC', 'OCTET_LENGTH', 'OF', 'OFFSET', 'ON', 'ONLY',
-                               'OPEN', 'OR', 'ORDER', 'OUTER', 'OVER', 'PARAMETER', 'PLAN',
-                               'POSITION', 'POST_EVENT', 'PRECISION', 'PRIMARY',
-                               'PROCEDURE', 'PUBLICATION', 'RDB$DB_KEY', 'RDB$ERROR',
-                               'RDB$GET_CONTEXT', 'RDB$GET_TRANSACTION_CN',
-                               'RDB$RECORD_VERSION', 'RDB$ROLE_IN_USE', 'RDB$SET_CONTEXT',
-                               'RDB$SYSTEM_PRIVILEGE', 'REAL', 'RECORD_VERSION',
-                               'RECREATE', 'RECURSIVE', 'REFERENCES', 'REGR_AVGX',
-                               'REGR_AVGY', 'REGR_COUNT', 'REGR_INTERCEPT', 'REGR_R2',
-                               'REGR_SLOPE', 'REGR_SXX', 'REGR_SXY', 'REGR_SYY', 'RELEASE',
-                               'RETURN', 'RETURNING_VALUES', 'RETURNS', 'REVOKE', 'RIGHT',
-                               'ROLLBACK', 'ROW', 'ROW_COUNT', 'ROWS', 'SAVEPOINT',
-                               'SCHEMA', 'SCROLL', 'SECOND', 'SELECT', 'SENSITIVE', 'SET',
-                               'SIMILAR', 'SMALLINT', 'SOME', 'SQLCODE', 'SQLSTATE',
-                               'START', 'STDDEV_POP', 'STDDEV_SAMP', 'SUM', 'TABLE',
-                               'THEN', 'TIME', 'TIMESTAMP', 'TIMEZONE_HOUR',
-                               'TIMEZONE_MINUTE', 'TO', 'TRAILING', 'TRIGGER', 'TRIM',
-                               'TRUE', 'UNBOUNDED', 'UNION', 'UNIQUE', 'UNKNOWN', 'UPDATE',
-                               'UPDATING', 'UPPER', 'USER', 'USING', 'VALUE', 'VALUES',
-                               'VAR_POP', 'VAR_SAMP', 'VARBINARY', 'VARCHAR', 'VARIABLE',
-                               'VARYING', 'VIEW', 'WHEN', 'WHERE', 'WHILE', 'WINDOW',
-                               'WITH', 'WITHOUT', 'YEAR']
+            self._reserved_ = _RESERVED_FB4
         elif self.ods == 13.1: # Firebird 5.0
-            self._ic.execute("SELECT RDB$KEYWORD_NAME FROM RDB$KEYWORDS WHERE RDB$KEYWORD_RESERVED")
-            self._reserved_ = [r[0] for r in self._ic]
+            # Keywords are the same for all databases on the same server version
+            version = self._con.info.version
+            if (reserved := _RESERVED_BY_VERSION.get(version)) is None:
+                self._ic.execute("SELECT RDB$KEYWORD_NAME FROM RDB$KEYWORDS WHERE RDB$KEYWORD_RESERVED")
+                reserved = _RESERVED_BY_VERSION[version] = frozenset(r[0] for r in self._ic)
+            self._reserved_ = reserved
         else:
             raise Error(f"Unsupported ODS version: {self.ods}")
-        self.__attrs = self._select_row('select * from RDB$DATABASE')
-        self._default_charset_name = self.__attrs['RDB$CHARACTER_SET_NAME'].strip()
-        self._ic.execute("select RDB$OWNER_NAME from RDB$RELATIONS where RDB$RELATION_NAME = 'RDB$DATABASE'")
-        self.__owner = self._ic.fetchone()[0].strip()
+        # Database owner is fetched together with database attributes
+        self.__attrs = self._select_row("""select d.*, (select RDB$OWNER_NAME from RDB$RELATIONS
+        where RDB$RELATION_NAME = 'RDB$DATABASE') as DB_OWNER_NAME from RDB$DATABASE d""")
+        self.__owner = self.__attrs.pop('DB_OWNER_NAME').strip()
+        # CHAR values are stripped only once here, not on every access
+        for attr in ('RDB$CHARACTER_SET_NAME', 'RDB$SECURITY_CLASS'):
+            if self.__attrs[attr] is not None:
+                self.__attrs[attr] = self.__attrs[attr].strip()
+        self._default_charset_name = self.__attrs['RDB$CHARACTER_SET_NAME']
         # Load enumerate types defined in RDB$TYPES table
+        types: Dict[str, Dict[int, str]] = {}
+        # Object type codes (reversed RDB$OBJECT_TYPE) are collected in the same pass
+        object_type_codes: Dict[str, int] = {}
+        # Names are trimmed by server, so rows could be used without further processing
+        for field_name, key, value in self._ic.execute('select trim(RDB$FIELD_NAME), RDB$TYPE, '
+                                                       'trim(RDB$TYPE_NAME) from RDB$TYPES'):
+            types.setdefault(field_name, {})[key] = value
+            if field_name == 'RDB$OBJECT_TYPE':
+                object_type_codes[value] = key
         def enum_dict(enum_type):
-            return {key: value.strip() for key, value
-                    in self._ic.execute('select RDB$TYPE, RDB$TYPE_NAME from RDB$TYPES '
-                                        'where RDB$FIELD_NAME = ?', (enum_type,))}
+            return types.get(enum_type, {})
         # Object types
         self.object_types = enum_dict('RDB$OBJECT_TYPE')
         # Object type codes
-        self.object_type_codes = {value: key for key, value in self.object_types.items()}
+        self.object_type_codes = object_type_codes
         # Character set names
         self.character_set_names = enum_dict('RDB$CHARACTER_SET_NAME')
         # Field types
@@ -1135,43 +1337,69 @@ class Schema(Visitable):
         self.__clear(data)
         if not self.closed:
             self._ic.transaction.commit()
+    def prefetch(self, data: Union[Category, List[Category]]=None) -> None:
+        """Loads all or specified categories of metadata objects at once, so they're
+        served from cache on next reference.
+
+        Arguments:
+            data: `None`, metadata category or list of categories.
+
+        Categories that are already loaded are not queried again.
+
+        Raises:
+            firebird.base.types.Error: For undefined metadata category.
+        """
+        self.__fail_if_closed()
+        if data:
+            if not isinstance(data, (list, tuple)):
+                data = (data, )
+        else:
+            data = _CATEGORY_LOADERS
+        for item in data:
+            if (loader := _CATEGORY_LOADERS.get(item)) is None:
+                raise Error(f"Unknown metadata category '{item}'")
+            loader(self)
+    def get_sequence_values(self, sequences: Iterable[Sequence]=None) -> Dict[str, int]:
+        """Returns current values of sequences (generators).
+
+        Arguments:
+            sequences: Sequences to read. All user sequences are read when not specified.
+
+        Returns:
+            Dictionary with current sequence values, with sequence names as keys.
+
+        Unlike `.Sequence.value` that queries the database for each sequence, values are
+        fetched using single query for up to 256 sequences.
+
+        .. versionadded:: 1.5.1
+        """
+        self.__fail_if_closed()
+        sequences = list(self.generators if sequences is None else sequences)
+        result = {}
+        for i in range(0, len(sequences), _SEQUENCE_BATCH_SIZE):
+            batch = sequences[i:i + _SEQUENCE_BATCH_SIZE]
+            self._ic.execute(f"select {','.join(f'GEN_ID({seq.get_quoted_name()},0)' for seq in batch)}"
+                             " from RDB$DATABASE")
+            result.update(zip((seq.name for seq in batch), self._ic.fetchone()))
+        return result
     def get_item(self, name: str, itype: ObjectType, subname: str=None) -> SchemaItem:
         """Return database object by type and name.
         """
+        if (attr := _ITEM_COLLECTIONS.get(itype)) is not None:
+            return getattr(self, attr).get(name)
         result = None
-        if itype is ObjectType.TABLE:
-            result = self.all_tables.get(name)
-        elif itype is ObjectType.VIEW:
-            result = self.all_views.get(name)
-        elif itype is ObjectType.TRIGGER:
-            result = self.all_triggers.get(name)
-        elif itype is ObjectType.PROCEDURE:
-            result = self.all_procedures.get(name)
-        elif itype is ObjectType.USER:
-            res = self._get_users().get(name)
-            if not res:
-                res = UserInfo(user_name=name)
-                self.__users.append(res)
-            result = res
+        if itype is ObjectType.USER:
+            if (result := self._get_users().get(name)) is None:
+                # Users not listed in RDB$USER_PRIVILEGES are created on demand
+                if self.__other_users is None:
+                    self.__other_users = {}
+                if (result := self.__other_users.get(name)) is None:
+                    result = self.__other_users[name] = UserInfo(user_name=name)
         elif itype is ObjectType.COLUMN:
             if subname is None:
                 result = self.all_domains.get(name)
             else:
                 result = self.all_tables.get(name).columns.get(subname)
-        elif itype is ObjectType.INDEX:
-            result = self.all_indices.get(name)
-        elif itype is ObjectType.CHARACTER_SET:
-            result = self.character_sets.get(name)
-        elif itype is ObjectType.ROLE:
-            result = self.roles.get(name)
-        elif itype is ObjectType.GENERATOR:
-            result = self.all_generators.get(name)
-        elif itype is ObjectType.UDF:
-            result = self.all_functions.get(name)
-        elif itype is ObjectType.COLLATION:
-            result = self.collations.get(name)
-        elif itype in (ObjectType.PACKAGE_HEADER, ObjectType.PACKAGE_BODY): # Package
-            result = self.packages.get(name)
         return result
     def get_metadata_ddl(self, *, sections=SCRIPT_DEFAULT_ORDER) -> List[str]:
         """Return list of DDL SQL commands for creation of specified categories of database objects.
@@ -1185,152 +1413,167 @@ class Schema(Visitable):
         Sections are created in the order of occurence in list. Uses `SCRIPT_DEFAULT_ORDER`
         list when sections are not specified.
         """
-        def order_by_dependency(items, get_dependencies):
+        return list(self.iter_metadata_ddl(sections=sections))
+    def iter_metadata_ddl(self, *, sections=SCRIPT_DEFAULT_ORDER) -> Iterator[str]:
+        """Returns iterator over DDL SQL commands for creation of specified categories of
+        database objects.
+
+        Keyword Args:
+            sections (list): List of section identifiers.
+
+        Same as `get_metadata_ddl()`, but commands are generated on demand, so the whole
+        script doesn't need to be kept in memory.
+
+        .. versionadded:: 1.5.1
+        """
+        def order_by_dependency(views: DataList[View]) -> List[View]:
+            # Topological sort (Kahn). Dependency graph is built from single pass over
+            # all dependencies, only dependencies between sorted views are considered.
+            blockers = {view.name: set() for view in views}
+            for dep in self.dependencies:
+                if (dep.dependent_type == ObjectType.VIEW
+                    and dep.depended_on_type == ObjectType.VIEW
+                    and dep.dependent_name != dep.depended_on_name
+                    and dep.dependent_name in blockers and dep.depended_on_name in blockers):
+                    blockers[dep.dependent_name].add(dep.depended_on_name)
+            dependents = {}
+            for view in views:
+                for name in blockers[view.name]:
+                    dependents.setdefault(name, []).append(view)
+            counts = {name: len(deps) for name, deps in blockers.items()}
+            ready = deque(view for view in views if not counts[view.name])
             ordered = []
-            wlist = list(items)
-            while len(wlist) > 0:
-                item = wlist.pop(0)
-                add = True
-                for dep in get_dependencies(item):
-                    if isinstance(dep.depended_on, View) and dep.depended_on not in ordered:
-                        wlist.append(item)
-                        add = False
-                        break
-                if add:
-                    ordered.append(item)
+            while ready:
+                view = ready.popleft()
+                ordered.append(view)
+                for dependent in dependents.get(view.name, ()):
+                    counts[dependent.name] -= 1
+                    if not counts[dependent.name]:
+                        ready.append(dependent)
+            # Views with circular dependencies are appended in original order
+            ordered.extend(view for view in views if counts[view.name])
             return ordered
-        def view_dependencies(item):
-            return [x for x in item.get_dependencies()
-                    if x.depended_on_type == 1]
+        constraints: Dict[ConstraintType, List[Constraint]] = None
+        def constraints_of(ctype: ConstraintType) -> List[Constraint]:
+            # Constraints are bucketed by type in single pass on first use
+            nonlocal constraints
+            if constraints is None:
+                constraints = {}
+                for constraint in self.constraints:
+                    constraints.setdefault(constraint.constraint_type, []).append(constraint)
+            return constraints.get(ctype, [])
+        def table_constraints(ctype: ConstraintType):
+            by_table = {}
+            for constraint in constraints_of(ctype):
+                by_table.setdefault(constraint._attributes['RDB$RELATION_NAME'], []).append(constraint)
+            return chain.from_iterable(by_table.get(table.name, ()) for table in self.tables)
+        subsets: Dict[str, List] = {}
+        def subset(name: str, items, predicate) -> List:
+            # Filtered lists used by more than one section are computed only once
+            if (result := subsets.get(name)) is None:
+                result = subsets[name] = [x for x in items if predicate(x)]
+            return result
+        def user_packages() -> List[Package]:
+            return subset('packages', self.packages, lambda x: not x.is_sys_object())
+        def standalone_functions() -> List[Function]:
+            return subset('functions', self.functions,
+                          lambda x: not x.is_external() and not x.is_packaged())
+        def standalone_procedures() -> List[Procedure]:
+            return subset('procedures', self.procedures, lambda x: not x.is_packaged())
+        def table_indices():
+            by_table = {}
+            for index in self.all_indices:
+                if not index.is_enforcer():
+                    by_table.setdefault(index._attributes['RDB$RELATION_NAME'], []).append(index)
+            return chain.from_iterable(by_table.get(table.name, ()) for table in self.tables)
         #
-        script = []
+        if categories := list(dict.fromkeys(chain.from_iterable(_SECTION_CATEGORIES.get(section, ())
+                                                                for section in sections))):
+            self.prefetch(categories)
+        def set_generators():
+            values = self.get_sequence_values(self.generators)
+            for generator in self.generators:
+                yield generator.get_sql_for('alter', value=values[generator.name])
+        def comments():
+            for obj in chain(self.character_sets, self.collations,
+                             self.exceptions, self.domains,
+                             self.generators, self.tables,
+                             self.indices, self.views,
+                             self.triggers, self.procedures,
+                             self.functions, self.roles):
+                if obj.description is not None:
+                    yield obj.get_sql_for('comment')
+                if isinstance(obj, (Table, View)):
+                    subitems = obj.columns
+                elif isinstance(obj, Procedure):
+                    subitems = chain(obj.input_params, obj.output_params)
+                else:
+                    continue
+                for subitem in subitems:
+                    if subitem.description is not None:
+                        yield subitem.get_sql_for('comment')
+        # Section handlers, each returns iterable of SQL commands for its section
+        handlers: Dict[Section, Callable[[], Iterable[str]]] = {
+            Section.COLLATIONS: lambda: (collation.get_sql_for('create')
+                                         for collation in self.collations
+                                         if not collation.is_sys_object()),
+            Section.CHARACTER_SETS: lambda: (charset.get_sql_for('alter',
+                                                                 collation=charset.default_collate.name)
+                                             for charset in self.character_sets
+                                             if charset.name != charset.default_collate.name),
+            Section.UDFS: lambda: (udf.get_sql_for('declare') for udf in self.functions
+                                   if udf.is_external()),
+            Section.GENERATORS: lambda: (generator.get_sql_for('create')
+                                         for generator in self.generators),
+            Section.EXCEPTIONS: lambda: (e.get_sql_for('create') for e in self.exceptions),
+            Section.DOMAINS: lambda: (domain.get_sql_for('create') for domain in self.domains),
+            Section.PACKAGE_DEFS: lambda: (package.get_sql_for('create')
+                                           for package in user_packages()),
+            Section.FUNCTION_DEFS: lambda: (func.get_sql_for('create', no_code=True)
+                                            for func in standalone_functions()),
+            Section.PROCEDURE_DEFS: lambda: (proc.get_sql_for('create', no_code=True)
+                                             for proc in standalone_procedures()),
+            Section.TABLES: lambda: (table.get_sql_for('create', no_pk=True, no_unique=True)
+                                     for table in self.tables),
+            Section.PRIMARY_KEYS: lambda: (constraint.get_sql_for('create') for constraint
+                                           in constraints_of(ConstraintType.PRIMARY_KEY)),
+            Section.UNIQUE_CONSTRAINTS: lambda: (constraint.get_sql_for('create') for constraint
+                                                 in table_constraints(ConstraintType.UNIQUE)),
+            Section.CHECK_CONSTRAINTS: lambda: (constraint.get_sql_for('create') for constraint
+                                                in table_constraints(ConstraintType.CHECK)),
+            Section.FOREIGN_CONSTRAINTS: lambda: (constraint.get_sql_for('create') for constraint
+                                                  in table_constraints(ConstraintType.FOREIGN_KEY)),
+            Section.INDICES: lambda: (index.get_sql_for('create') for index in table_indices()),
+            Section.VIEWS: lambda: (view.get_sql_for('create')
+                                    for view in order_by_dependency(self.views)),
+            Section.PACKAGE_BODIES: lambda: (package.get_sql_for('create', body=True)
+                                             for package in user_packages()),
+            Section.PROCEDURE_BODIES: lambda: (proc._get_definition_sql('ALTER')
+                                               for proc in standalone_procedures()),
+            Section.FUNCTION_BODIES: lambda: (func._get_definition_sql('ALTER')
+                                              for func in standalone_functions()),
+            Section.TRIGGERS: lambda: (trigger.get_sql_for('create') for trigger in self.triggers),
+            Section.ROLES: lambda: (role.get_sql_for('create') for role in self.roles
+                                    if not role.is_sys_object()),
+            Section.GRANTS: lambda: (priv.get_sql_for('grant') for priv in self.privileges
+                                     if priv.user_name != 'SYSDBA'
+                                     and not priv.subject.is_sys_object()),
+            Section.COMMENTS: comments,
+            Section.SHADOWS: lambda: (shadow.get_sql_for('create') for shadow in self.shadows),
+            Section.INDEX_DEACTIVATIONS: lambda: (index.get_sql_for('deactivate')
+                                                  for index in self.indices),
+            Section.INDEX_ACTIVATIONS: lambda: (index.get_sql_for('activate')
+                                                for index in self.indices),
+            Section.SET_GENERATORS: set_generators,
+            Section.TRIGGER_DEACTIVATIONS: lambda: (trigger.get_sql_for('alter', active=False)
+                                                    for trigger in self.triggers),
+            Section.TRIGGER_ACTIVATIONS: lambda: (trigger.get_sql_for('alter', active=True)
+                                                  for trigger in self.triggers),
+            }
         for section in sections:
-            if section == Section.COLLATIONS:
-                for collation in self.collations:
-                    if not collation.is_sys_object():
-                        script.append(collation.get_sql_for('create'))
-            elif section == Section.CHARACTER_SETS:
-                for charset in self.character_sets:
-                    if charset.name != charset.default_collate.name:
-                        script.append(charset.get_sql_for('alter',
-                                                          collation=charset.default_collate.name))
-            elif section == Section.UDFS:
-                for udf in self.functions:
-                    if udf.is_external():
-                        script.append(udf.get_sql_for('declare'))
-            elif section == Section.GENERATORS:
-                for generator in self.generators:
-                    script.append(generator.get_sql_for('create'))
-            elif section == Section.EXCEPTIONS:
-                for e in self.exceptions:
-                    script.append(e.get_sql_for('create'))
-            elif section == Section.DOMAINS:
-                for domain in self.domains:
-                    script.append(domain.get_sql_for('create'))
-            elif section == Section.PACKAGE_DEFS:
-                for package in self.packages:
-                    if not package.is_sys_object():
-                        script.append(package.get_sql_for('create'))
-            elif section == Section.FUNCTION_DEFS:
-                for func in (x for x in self.functions if
-                             not x.is_external() and
-                             not x.is_packaged()):
-                    script.append(func.get_sql_for('create', no_code=True))
-            elif section == Section.PROCEDURE_DEFS:
-                for proc in (x for x in self.procedures if not x.is_packaged()):
-                    script.append(proc.get_sql_for('create', no_code=True))
-            elif section == Section.TABLES:
-                for table in self.tables:
-                    script.append(table.get_sql_for('create', no_pk=True, no_unique=True))
-            elif section == Section.PRIMARY_KEYS:
-                for constraint in (x for x in self.constraints if x.is_pkey()):
-                    script.append(constraint.get_sql_for('create'))
-            elif section == Section.UNIQUE_CONSTRAINTS:
-                for table in self.tables:
-                    for constraint in (x for x in table.constraints if x.is_unique()):
-                        script.append(constraint.get_sql_for('create'))
-            elif section == Section.CHECK_CONSTRAINTS:
-                for table in self.tables:
-                    for constraint in (x for x in table.constraints if x.is_check()):
-                        script.append(constraint.get_sql_for('create'))
-            elif section == Section.FOREIGN_CONSTRAINTS:
-                for table in self.tables:
-                    for constraint in (x for x in table.constraints if x.is_fkey()):
-                        script.append(constraint.get_sql_for('create'))
-            elif section == Section.INDICES:
-                for table in self.tables:
-                    for index in (x for x in table.indices
-                                  if not x.is_enforcer()):
-                        script.append(index.get_sql_for('create'))
-            elif section == Section.VIEWS:
-                for view in order_by_dependency(self.views, view_dependencies):
-                    script.append(view.get_sql_for('create'))
-            elif section == Section.PACKAGE_BODIES:
-                for package in self.packages:
-                    if not package.is_sys_object():
-                        script.append(package.get_sql_for('create', body=True))
-            elif section == Section.PROCEDURE_BODIES:
-                for proc in (x for x in self.procedures if not x.is_packaged()):
-                    script.append('ALTER' + proc.get_sql_for('create')[6:])
-            elif section == Section.FUNCTION_BODIES:
-                for func in (x for x in self.functions if
-                             not x.is_external() and
-                             not x.is_packaged()):
-                    script.append('ALTER' + func.get_sql_for('create')[6:])
-            elif section == Section.TRIGGERS:
-                for trigger in self.triggers:
-                    script.append(trigger.get_sql_for('create'))
-            elif section == Section.ROLES:
-                for role in (x for x in self.roles if not x.is_sys_object()):
-                    script.append(role.get_sql_for('create'))
-            elif section == Section.GRANTS:
-                for priv in (x for x in self.privileges
-                             if x.user_name != 'SYSDBA'
-                             and not x.subject.is_sys_object()):
-                    script.append(priv.get_sql_for('grant'))
-            elif section == Section.COMMENTS:
-                for objects in (self.character_sets, self.collations,
-                                self.exceptions, self.domains,
-                                self.generators, self.tables,
-                                self.indices, self.views,
-                                self.triggers, self.procedures,
-                                self.functions, self.roles):
-                    for obj in objects:
-                        if obj.description is not None:
-                            script.append(obj.get_sql_for('comment'))
-                        if isinstance(obj, (Table, View)):
-                            for col in obj.columns:
-                                if col.description is not None:
-                                    script.append(col.get_sql_for('comment'))
-                        elif isinstance(obj, Procedure):
-                            if isinstance(obj, (Table, View)):
-                                for par in obj.input_params:
-                                    if par.description is not None:
-                                        script.append(par.get_sql_for('comment'))
-                                for par in obj.output_params:
-                                    if par.description is not None:
-                                        script.append(par.get_sql_for('comment'))
-            elif section == Section.SHADOWS:
-                for shadow in self.shadows:
-                    script.append(shadow.get_sql_for('create'))
-            elif section == Section.INDEX_DEACTIVATIONS:
-                for index in self.indices:
-                    script.append(index.get_sql_for('deactivate'))
-            elif section == Section.INDEX_ACTIVATIONS:
-                for index in self.indices:
-                    script.append(index.get_sql_for('activate'))
-            elif section == Section.SET_GENERATORS:
-                for generator in self.generators:
-                    script.append(generator.get_sql_for('alter', value=generator.value))
-            elif section == Section.TRIGGER_DEACTIVATIONS:
-                for trigger in self.triggers:
-                    script.append(trigger.get_sql_for('alter', active=False))
-            elif section == Section.TRIGGER_ACTIVATIONS:
-                for trigger in self.triggers:
-                    script.append(trigger.get_sql_for('alter', active=True))
-            else:
+            if (handler := handlers.get(section)) is None:
                 raise ValueError(f"Unknown section code {section}")
-        return script
+            yield from handler()
     def is_keyword(self, ident: str) -> bool:
         """Return True if `ident` is a Firebird keyword.
         """
@@ -1349,7 +1592,13 @@ class Schema(Visitable):
         Returns:
             `.Collation` with specified ID or `None`.
         """
-        return self.collations.find(lambda i: i.character_set.id == charset_id and i.id == collation_id)
+        if self.__collation_index is None:
+            index = {}
+            for collation in self.collations:
+                index.setdefault((collation._attributes['RDB$CHARACTER_SET_ID'], collation.id),
+                                 collation)
+            self.__collation_index = index
+        return self.__collation_index.get((charset_id, collation_id))
     def get_charset_by_id(self, charset_id: int) -> CharacterSet:
         """
         Arguments:
@@ -1358,7 +1607,12 @@ class Schema(Visitable):
         Returns:
             `.CharacterSet` with specified ID or `None`.
         """
-        return self.character_sets.find(lambda i: i.id == charset_id)
+        if self.__charset_index is None:
+            index = {}
+            for charset in self.character_sets:
+                index.setdefault(charset.id, charset)
+            self.__charset_index = index
+        return self.__charset_index.get(charset_id)
     def get_privileges_of(self, user: Union[str, UserInfo, Table, View, Procedure, Trigger, Role],
                           user_type: ObjectType=None) -> DataList[Privilege]:
         """Get list of all privileges granted to user/database object.
@@ -1383,8 +1637,8 @@ class Schema(Visitable):
         elif isinstance(user, UserInfo):
             uname = user.user_name
             utype = [ObjectType.USER]
-        return self.privileges.extract(lambda p: (p.user_name == uname)
-                                       and (p.user_type in utype), copy=True)
+        return DataList((p for p in self._get_privilege_index()[0].get(uname, ())
+                         if p.user_type in utype), Privilege)
     @property
     def closed(self) -> bool:
         """True if schema is not bound to database connection.
@@ -1409,15 +1663,15 @@ class Schema(Visitable):
     def security_class(self) -> str:
         """Can refer to the security class applied as databasewide access control limits.
         """
-        return self.__attrs['RDB$SECURITY_CLASS'].strip()
+        return self.__attrs['RDB$SECURITY_CLASS']
     @property
     def collations(self) -> DataList[Collation]:
         """List of all collations in database.
         """
         if self.__collations is None:
             self.__fail_if_closed()
-            self.__collations = DataList((Collation(self, row) for row
-                                          in self._select('select * from rdb$collations')),
+            self.__collations = DataList([Collation(self._self_proxy, row) for row
+                                          in self._select('select * from rdb$collations')],
                                          Collation, 'item.name', frozen=True)
         return self.__collations
     @property
@@ -1426,8 +1680,8 @@ class Schema(Visitable):
         """
         if self.__character_sets is None:
             self.__fail_if_closed()
-            self.__character_sets = DataList((CharacterSet(self, row) for row
-                                              in self._select('select * from rdb$character_sets')),
+            self.__character_sets = DataList([CharacterSet(self._self_proxy, row) for row
+                                              in self._select(self._prepare(_SQL_CHARACTER_SETS))],
                                              CharacterSet, 'item.name', frozen=True)
         return self.__character_sets
     @property
@@ -1436,8 +1690,8 @@ class Schema(Visitable):
         """
         if self.__exceptions is None:
             self.__fail_if_closed()
-            self.__exceptions = DataList((DatabaseException(self, row) for row
-                                          in self._select('select * from rdb$exceptions')),
+            self.__exceptions = DataList([DatabaseException(self._self_proxy, row) for row
+                                          in self._select('select * from rdb$exceptions')],
                                          DatabaseException, 'item.name', frozen=True)
 
         return self.__exceptions
@@ -1552,10 +1806,6 @@ class Schema(Visitable):
         """
         if self.__constraints is None:
             self.__fail_if_closed()
-            # Dummy call to _get_all_tables() is necessary as
-            # Constraint.is_sys_object() that is called in Constraint.__init__()
-            # will drop result from internal cursor and we'll not load all constraints.
-            self._get_all_tables()
             cmd = """select c.RDB$CONSTRAINT_NAME,
 c.RDB$CONSTRAINT_TYPE, c.RDB$RELATION_NAME, c.RDB$DEFERRABLE,
 c.RDB$INITIALLY_DEFERRED, c.RDB$INDEX_NAME, r.RDB$CONST_NAME_UQ,
@@ -1564,20 +1814,23 @@ k.RDB$TRIGGER_NAME from rdb$relation_constraints C
 left outer join rdb$ref_constraints R on C.rdb$constraint_name = R.rdb$constraint_name
 left outer join rdb$check_constraints K on (C.rdb$constraint_name = K.rdb$constraint_name)
 and (c.RDB$CONSTRAINT_TYPE in ('CHECK','NOT NULL'))"""
-            self.__constraints = DataList((Constraint(self, row) for row
-                                           in self._select(cmd)), Constraint, 'item.name')
             # Check constrains need special care because they're doubled
-            # (select above returns two records for them with different trigger names)
-            checks = self.__constraints.extract(lambda item: item.is_check())
-            dchecks = {}
-            for check in checks:
-                dchecks.setdefault(check.name, []).append(check)
-            for checklist in dchecks.values():
-                names = [c._attributes['RDB$TRIGGER_NAME'] for c in checklist]
-                check = checklist[0]
-                check._attributes['RDB$TRIGGER_NAME'] = names
-                self.__constraints.append(check)
-            self.__constraints.freeze()
+            # (select above returns two records for them with different trigger names),
+            # so rows are grouped into single constraint with list of trigger names.
+            constraints = []
+            checks: Dict[str, Constraint] = {}
+            for row in self._select(cmd):
+                if (check := checks.get(row['RDB$CONSTRAINT_NAME'].strip())) is not None:
+                    check._attributes['RDB$TRIGGER_NAME'].append(row['RDB$TRIGGER_NAME'].strip())
+                    continue
+                constraint = Constraint(self._self_proxy, row)
+                if constraint.is_check():
+                    row['RDB$TRIGGER_NAME'] = [row['RDB$TRIGGER_NAME']]
+                    checks[constraint.name] = constraint
+                else:
+                    constraints.append(constraint)
+            constraints.extend(checks.values())
+            self.__constraints = DataList(constraints, Constraint, 'item.name', frozen=True)
         return self.__constraints
     @property
     def roles(self) -> DataList[Role]:
@@ -1585,10 +1838,9 @@ and (c.RDB$CONSTRAINT_TYPE in ('CHECK','NOT NULL'))"""
         """
         if self.__roles is None:
             self.__fail_if_closed()
-            self.__roles = DataList((Role(self, row) for row
-                                     in self._select('select * from rdb$roles')),
-                                    Role, 'item.name')
-            self.__roles.freeze()
+            self.__roles = DataList([Role(self._self_proxy, row) for row
+                                     in self._select(self._prepare(_SQL_ROLES))],
+                                    Role, 'item.name', frozen=True)
         return self.__roles
     @property
     def dependencies(self) -> DataList[Dependency]:
@@ -1596,8 +1848,8 @@ and (c.RDB$CONSTRAINT_TYPE in ('CHECK','NOT NULL'))"""
         """
         if self.__dependencies is None:
             self.__fail_if_closed()
-            self.__dependencies = DataList((Dependency(self, row) for row
-                                            in self._select('select * from rdb$dependencies')),
+            self.__dependencies = DataList([Dependency(self._self_proxy, row) for row
+                                            in self._select('select * from rdb$dependencies')],
                                            Dependency)
         return self.__dependencies
     @property
@@ -1625,9 +1877,8 @@ and (c.RDB$CONSTRAINT_TYPE in ('CHECK','NOT NULL'))"""
 RDB$FILE_START, RDB$FILE_LENGTH from RDB$FILES
 where RDB$SHADOW_NUMBER = 0
 order by RDB$FILE_SEQUENCE"""
-            self.__files = DataList((DatabaseFile(self, row) for row
-                                     in self._select(cmd)), DatabaseFile, 'item.name')
-            self.__files.freeze()
+            self.__files = DataList([DatabaseFile(self._self_proxy, row) for row
+                                     in self._select(cmd)], DatabaseFile, 'item.name', frozen=True)
         return self.__files
     @property
     def shadows(self) -> DataList[Shadow]:
@@ -1639,9 +1890,8 @@ order by RDB$FILE_SEQUENCE"""
 from RDB$FILES
 where RDB$SHADOW_NUMBER > 0 AND RDB$FILE_SEQUENCE = 0
 order by RDB$SHADOW_NUMBER"""
-            self.__shadows = DataList((Shadow(self, row) for row
-                                       in self._select(cmd)), Shadow, 'item.name')
-            self.__shadows.freeze()
+            self.__shadows = DataList([Shadow(self._self_proxy, row) for row
+                                       in self._select(cmd)], Shadow, 'item.name', frozen=True)
         return self.__shadows
     @property
     def privileges(self) -> DataList[Privilege]:
@@ -1652,8 +1902,8 @@ order by RDB$SHADOW_NUMBER"""
             cmd = """select RDB$USER, RDB$GRANTOR, RDB$PRIVILEGE,
 RDB$GRANT_OPTION, RDB$RELATION_NAME, RDB$FIELD_NAME, RDB$USER_TYPE, RDB$OBJECT_TYPE
 FROM RDB$USER_PRIVILEGES"""
-            self.__privileges = DataList((Privilege(self, row) for row
-                                          in self._select(cmd)), Privilege)
+            self.__privileges = DataList([Privilege(self._self_proxy, row) for row
+                                          in self._select(cmd)], Privilege)
         return self.__privileges
     @property
     def backup_history(self) -> DataList[BackupHistory]:
@@ -1664,9 +1914,8 @@ FROM RDB$USER_PRIVILEGES"""
             cmd = """SELECT RDB$BACKUP_ID, RDB$TIMESTAMP,
 RDB$BACKUP_LEVEL, RDB$GUID, RDB$SCN, RDB$FILE_NAME
 FROM RDB$BACKUP_HISTORY"""
-            self.__backup_history = DataList((BackupHistory(self, row) for row
-                                              in self._select(cmd)), BackupHistory, 'item.name')
-            self.__backup_history.freeze()
+            self.__backup_history = DataList([BackupHistory(self._self_proxy, row) for row
+                                              in self._select(cmd)], BackupHistory, 'item.name', frozen=True)
         return self.__backup_history
     @property
     def filters(self) -> DataList[Filter]:
@@ -1677,9 +1926,8 @@ FROM RDB$BACKUP_HISTORY"""
             cmd = """SELECT RDB$FUNCTION_NAME, RDB$DESCRIPTION,
 RDB$MODULE_NAME, RDB$ENTRYPOINT, RDB$INPUT_SUB_TYPE, RDB$OUTPUT_SUB_TYPE, RDB$SYSTEM_FLAG
 FROM RDB$FILTERS"""
-            self.__filters = DataList((Filter(self, row) for row
-                                       in self._select(cmd)), Filter, 'item.name')
-            self.__filters.freeze()
+            self.__filters = DataList([Filter(self._self_proxy, row) for row
+                                       in self._select(cmd)], Filter, 'item.name', frozen=True)
         return self.__filters
     @property
     def packages(self) -> DataList[Package]:
@@ -1691,9 +1939,8 @@ FROM RDB$FILTERS"""
 RDB$PACKAGE_BODY_SOURCE, RDB$VALID_BODY_FLAG, RDB$SECURITY_CLASS, RDB$OWNER_NAME,
 RDB$SYSTEM_FLAG, RDB$DESCRIPTION
             FROM RDB$PACKAGES"""
-            self.__packages = DataList((Package(self, row) for row
-                                        in self._select(cmd)), Package, 'item.name')
-            self.__packages.freeze()
+            self.__packages = DataList([Package(self._self_proxy, row) for row
+                                        in self._select(cmd)], Package, 'item.name', frozen=True)
         return self.__packages
     @property
     def linger(self) -> Optional[int]:
@@ -1704,64 +1951,96 @@ RDB$SYSTEM_FLAG, RDB$DESCRIPTION
 class SchemaItem(Visitable):
     """Base class for all database schema objects.
     """
-    schema: Schema = None
+    __slots__ = ('__weakref__', 'schema', '_attributes', '_actions', '_is_sys', '_quoted_name')
+    #: Names of CHAR attributes that are stripped of trailing spaces on creation.
+    _STRIP_COLS: Tuple[str, ...] = ()
+    #: Object type codes of this schema object class.
+    _type_code: Tuple[ObjectType, ...] = ()
+    #: SQL actions supported by all instances.
+    _ACTIONS: Tuple[str, ...] = ()
+    #: SQL actions supported by user (non-system) instances.
+    _USER_ACTIONS: Tuple[str, ...] = ()
+    #: Object keyword used in COMMENT ON command.
+    _COMMENT_KEYWORD: Optional[str] = None
+    #: SQL command generators `_get_<action>_sql` by action name, built for each subclass.
+    _action_map: Dict[str, Callable[..., str]] = {}
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._action_map = {m.group(1): getattr(cls, name) for name in dir(cls)
+                           if (m := _SQL_GENERATOR_NAME(name))}
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         #: Weak reference to parent `.Schema` instance.
-        self.schema: Schema = schema if isinstance(schema, weakref.ProxyType) else weakref.proxy(schema)
-        self._type_code: List[ObjectType] = []
+        self.schema: Schema = schema if type(schema) is weakref.ProxyType else weakref.proxy(schema)
         self._attributes: Dict[str, Any] = attributes
-        self._actions: List[str] = []
-    def _strip_attribute(self, attr: str) -> None:
-        if self._attributes.get(attr):
-            self._attributes[attr] = self._attributes[attr].strip()
+        self._actions: Tuple[str, ...] = self._ACTIONS
+        self._is_sys: Optional[bool] = None
+        self._quoted_name: Optional[str] = None
+        for attr in self._STRIP_COLS:
+            value = attributes.get(attr)
+            if value:
+                attributes[attr] = value.strip()
+    def _get_stripped(self, attr: str) -> Optional[str]:
+        # Rarely used CHAR attributes are not stripped on creation, but on first access
+        if value := self._attributes.get(attr):
+            value = self._attributes[attr] = value.strip()
+        return value
     def _check_params(self, params: Dict[str, Any], param_names: List[str]) -> None:
-        p = set(params.keys())
-        n = set(param_names)
-        if not p.issubset(n):
-            raise ValueError(f"Unsupported parameter(s) '{','.join(p.difference(n))}'")
+        # Most generators are called without parameters, so there is nothing to check
+        if params and (unsupported := params.keys() - set(param_names)):
+            raise ValueError(f"Unsupported parameter(s) '{','.join(unsupported)}'")
     def _needs_quoting(self, ident: str) -> bool:
         if not ident:
             return False
         if self.schema.opt_always_quote:
             return True
-        if ident and ident[0] not in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
+        if _needs_quoting_chars(ident):
             return True
-        for char in ident:
-            if char not in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789$_':
-                return True
         return self.schema.is_keyword(ident)
     def _get_quoted_ident(self, ident: str) -> str:
-        return f'"{ident}"' if self._needs_quoting(ident) else ident
+        if self.schema.opt_always_quote:
+            return f'"{ident}"' if ident else ident
+        cache = self.schema._quoted_idents
+        if (result := cache.get(ident)) is None:
+            result = cache[ident] = f'"{ident}"' if self._needs_quoting(ident) else ident
+        return result
     def _get_name(self) -> Optional[str]:
         return None
     def _get_create_sql(self, **params) -> str:
         raise NotImplementedError
     def _get_recreate_sql(self, **params) -> str:
         return 'RE'+self._get_create_sql(**params)
+    def _get_comment_sql(self, **params) -> str:
+        "Returns SQL command to COMMENT object."
+        return f'COMMENT ON {self._COMMENT_KEYWORD} {self.get_quoted_name()} ' \
+               f'IS {_sql_string_lit(self.description)}'
     def _get_create_or_alter_sql(self, **params) -> str:
         return 'CREATE OR ALTER' + self._get_create_sql(**params)[6:]
+    def _check_sys_object(self) -> bool:
+        return self._attributes.get('RDB$SYSTEM_FLAG', 0) > 0
     def is_sys_object(self) -> bool:
         """Returns True if this database object is system object.
         """
-        return self._attributes.get('RDB$SYSTEM_FLAG', 0) > 0
+        if self._is_sys is None:
+            self._is_sys = self._check_sys_object()
+        return self._is_sys
     def get_quoted_name(self) -> str:
         """Returns quoted (if necessary) name.
         """
-        return self._get_quoted_ident(self.name)
+        if self.schema.opt_always_quote:
+            return self._get_quoted_ident(self.name)
+        if (result := self._quoted_name) is None:
+            result = self._quoted_name = self._get_quoted_ident(self.name)
+        return result
     def get_dependents(self) -> DataList[Dependency]:
         """Returns list of all database objects that depend on this one.
         """
-        result = self.schema.dependencies.extract(lambda d: d.depended_on_name == self.name and
-                                                  d.depended_on_type in self._type_code, copy=True)
-        result.freeze()
-        return result
+        return DataList((d for d in self.schema._get_dependency_index()[0].get(self.name, ())
+                         if d.depended_on_type in self._type_code), Dependency, frozen=True)
     def get_dependencies(self) -> DataList[Dependency]:
         """Returns list of all database objects that this object depend on.
         """
-        result = self.schema.dependencies.extract(lambda d: d.dependent_name == self.name and
-                                                  d.dependent_type in self._type_code, copy=True)
-        result.freeze()
-        return result
+        return DataList((d for d in self.schema._get_dependency_index()[1].get(self.name, ())
+                         if d.dependent_type in self._type_code), Dependency, frozen=True)
     def get_sql_for(self, action: str, **params: Dict) -> str:
         """Returns SQL command for specified action on metadata object.
 
@@ -1771,7 +2050,7 @@ class SchemaItem(Visitable):
             ValueError: For unsupported action or wrong parameters passed.
         """
         if (_action := action.lower()) in self._actions:
-            return getattr(self, f'_get_{_action}_sql')(**params)
+            return self._action_map[_action](self, **params)
         raise ValueError(f"Unsupported action '{action}'")
     @property
     def name(self) -> str:
@@ -1787,7 +2066,7 @@ class SchemaItem(Visitable):
     def actions(self) -> List[str]:
         """List of supported SQL operations on metadata object instance.
         """
-        return self._actions
+        return list(self._actions)
 
 class Collation(SchemaItem):
     """Represents collation.
@@ -1796,17 +2075,16 @@ class Collation(SchemaItem):
         - User collation: `create`, `drop`, `comment`
         - System collation: `comment`
     """
+    __slots__ = ()
+    _STRIP_COLS = ('RDB$COLLATION_NAME', 'RDB$BASE_COLLATION_NAME')
+    _type_code = (ObjectType.COLLATION,)
+    _ACTIONS = ('comment',)
+    _USER_ACTIONS = ('comment', 'create', 'drop')
+    _COMMENT_KEYWORD = 'COLLATION'
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.append(ObjectType.COLLATION)
-        self._strip_attribute('RDB$COLLATION_NAME')
-        self._strip_attribute('RDB$BASE_COLLATION_NAME')
-        self._strip_attribute('RDB$FUNCTION_NAME')
-        self._strip_attribute('RDB$SECURITY_CLASS')
-        self._strip_attribute('RDB$OWNER_NAME')
-        self._actions.append('comment')
         if not self.is_sys_object():
-            self._actions.extend(['create', 'drop'])
+            self._actions = self._USER_ACTIONS
     def _get_drop_sql(self, **params) -> str:
         "Returns SQL command to DROP collation."
         self._check_params(params, [])
@@ -1818,19 +2096,10 @@ class Collation(SchemaItem):
             from_ = f"FROM EXTERNAL ('{self._attributes['RDB$BASE_COLLATION_NAME']}')"
         else:
             from_ = f"FROM {self.base_collation.get_quoted_name()}"
-        spec = f"\n   '{self.specific_attributes}'" if self.specific_attributes else ''
-        return f"CREATE COLLATION {self.get_quoted_name()}\n" \
-               f"   FOR {self.character_set.get_quoted_name()}\n" \
-               f"   {from_}\n" \
-               f"   {'PAD SPACE' if CollationFlag.PAD_SPACE in self.attributes else 'NO PAD'}\n" \
-               f"   {'CASE INSENSITIVE' if CollationFlag.CASE_INSENSITIVE in self.attributes else 'CASE SENSITIVE'}\n" \
-               f"   {'ACCENT INSENSITIVE' if CollationFlag.ACCENT_INSENSITIVE in self.attributes else 'ACCENT SENSITIVE'}" \
-               f"{spec}"
-    def _get_comment_sql(self, **params) -> str:
-        "Returns SQL command to COMMENT collation."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
-        return f'COMMENT ON COLLATION {self.get_quoted_name()} IS {comment}'
+        pad, case, accent = _COLLATION_FLAG_SQL[self._attributes['RDB$COLLATION_ATTRIBUTES'] & 7]
+        spec = f"\n   '{spec}'" if (spec := self.specific_attributes) else ''
+        return f"CREATE COLLATION {self.get_quoted_name()}\n   FOR {self.character_set.get_quoted_name()}" \
+               f"\n   {from_}\n   {pad}\n   {case}\n   {accent}{spec}"
     def _get_name(self) -> str:
         return self._attributes['RDB$COLLATION_NAME']
     def is_based_on_external(self) -> bool:
@@ -1867,17 +2136,17 @@ class Collation(SchemaItem):
     def function_name(self) -> str:
         """Not currently used.
         """
-        return self._attributes['RDB$FUNCTION_NAME']
+        return self._get_stripped('RDB$FUNCTION_NAME')
     @property
     def security_class(self) -> str:
         """Security class name or None.
         """
-        return self._attributes.get('RDB$SECURITY_CLASS')
+        return self._get_stripped('RDB$SECURITY_CLASS')
     @property
     def owner_name(self) -> str:
         """Creator's user name.
         """
-        return self._attributes.get('RDB$OWNER_NAME')
+        return self._get_stripped('RDB$OWNER_NAME')
 
 class CharacterSet(SchemaItem):
     """Represents character set.
@@ -1885,15 +2154,11 @@ class CharacterSet(SchemaItem):
     Supported SQL actions:
         `alter` (collation=Collation instance or collation name), `comment`
     """
-    def __init__(self, schema: Schema, attributes: Dict[str, Any]):
-        super().__init__(schema, attributes)
-        self._type_code.append(ObjectType.CHARACTER_SET)
-        self._strip_attribute('RDB$CHARACTER_SET_NAME')
-        self._strip_attribute('RDB$DEFAULT_COLLATE_NAME')
-        self._strip_attribute('RDB$SECURITY_CLASS')
-        self._strip_attribute('RDB$OWNER_NAME')
-        self._actions.extend(['alter', 'comment'])
-        self.__collations: DataList= None
+    __slots__ = ()
+    _STRIP_COLS = ('RDB$CHARACTER_SET_NAME', 'RDB$DEFAULT_COLLATE_NAME')
+    _type_code = (ObjectType.CHARACTER_SET,)
+    _ACTIONS = ('alter', 'comment')
+    _COMMENT_KEYWORD = 'CHARACTER SET'
     def _get_alter_sql(self, **params) -> str:
         "Returns SQL command to ALTER charset."
         self._check_params(params, ['collation'])
@@ -1902,18 +2167,13 @@ class CharacterSet(SchemaItem):
             return f'ALTER CHARACTER SET {self.get_quoted_name()} SET DEFAULT COLLATION ' \
                    f'{collation.get_quoted_name() if isinstance(collation, Collation) else collation}'
         raise ValueError("Missing required parameter: 'collation'.")
-    def _get_comment_sql(self, **params) -> str:
-        "Returns SQL command to COMMENT charset."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
-        return f'COMMENT ON CHARACTER SET {self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$CHARACTER_SET_NAME']
     def get_collation_by_id(self, id_: int) -> Optional[Collation]:
         """Return :class:`Collation` object with specified `id_` that belongs to
         this character set.
         """
-        return self.collations.find(lambda item: item.id == id_)
+        return self.schema.get_collation_by_id(self.id, id_)
     @property
     def id(self) -> int:
         """Character set ID.
@@ -1933,22 +2193,19 @@ class CharacterSet(SchemaItem):
     def collations(self) -> DataList[Collation]:
         """List of collations associated with character set.
         """
-        if self.__collations is None:
-            self.__collations = self.schema.collations.extract(lambda i:
-                                                               i._attributes['RDB$CHARACTER_SET_ID'] == self.id,
-                                                               copy=True)
-            self.__collations.freeze()
-        return self.__collations
+        if (result := self.schema._get_charset_collations().get(self.id)) is None:
+            result = DataList(type_spec=Collation, key_expr='item.name', frozen=True)
+        return result
     @property
     def security_class(self) -> str:
         """Security class name or None.
         """
-        return self._attributes.get('RDB$SECURITY_CLASS')
+        return self._get_stripped('RDB$SECURITY_CLASS')
     @property
     def owner_name(self) -> str:
         """Creator user name.
         """
-        return self._attributes.get('RDB$OWNER_NAME')
+        return self._get_stripped('RDB$OWNER_NAME')
 
 class DatabaseException(SchemaItem):
     """Represents database exception.
@@ -1958,15 +2215,16 @@ class DatabaseException(SchemaItem):
           `drop`, `comment`
         - System exception: `comment`
     """
+    __slots__ = ()
+    _STRIP_COLS = ('RDB$EXCEPTION_NAME',)
+    _type_code = (ObjectType.EXCEPTION,)
+    _ACTIONS = ('comment',)
+    _USER_ACTIONS = ('comment', 'create', 'recreate', 'alter', 'create_or_alter', 'drop')
+    _COMMENT_KEYWORD = 'EXCEPTION'
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.append(ObjectType.EXCEPTION)
-        self._strip_attribute('RDB$EXCEPTION_NAME')
-        self._strip_attribute('RDB$SECURITY_CLASS')
-        self._strip_attribute('RDB$OWNER_NAME')
-        self._actions.append('comment')
         if not self.is_sys_object():
-            self._actions.extend(['create', 'recreate', 'alter', 'create_or_alter', 'drop'])
+            self._actions = self._USER_ACTIONS
     def _get_create_sql(self, **params) -> str:
         "Returns SQL command to CREATE exception."
         self._check_params(params, [])
@@ -1982,11 +2240,6 @@ class DatabaseException(SchemaItem):
         "Returns SQL command to DROP exception."
         self._check_params(params, [])
         return f'DROP EXCEPTION {self.get_quoted_name()}'
-    def _get_comment_sql(self, **params) -> str:
-        "Returns SQL command to COMMENT exception."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
-        return f'COMMENT ON EXCEPTION {self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$EXCEPTION_NAME']
     @property
@@ -2003,12 +2256,12 @@ class DatabaseException(SchemaItem):
     def security_class(self) -> str:
         """Security class name or None.
         """
-        return self._attributes.get('RDB$SECURITY_CLASS')
+        return self._get_stripped('RDB$SECURITY_CLASS')
     @property
     def owner_name(self) -> str:
         """Creator's user name.
         """
-        return self._attributes.get('RDB$OWNER_NAME')
+        return self._get_stripped('RDB$OWNER_NAME')
 
 class Sequence(SchemaItem):
     """Represents database generator/sequence.
@@ -2018,15 +2271,15 @@ class Sequence(SchemaItem):
           `alter` (value=number, increment=number), `drop`, `comment`
         - System sequence: `comment`
     """
+    __slots__ = ()
+    _STRIP_COLS = ('RDB$GENERATOR_NAME',)
+    _type_code = (ObjectType.GENERATOR,)
+    _ACTIONS = ('comment',)
+    _USER_ACTIONS = ('comment', 'create', 'alter', 'drop')
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.append(ObjectType.GENERATOR)
-        self._strip_attribute('RDB$GENERATOR_NAME')
-        self._strip_attribute('RDB$SECURITY_CLASS')
-        self._strip_attribute('RDB$OWNER_NAME')
-        self._actions.append('comment')
         if not self.is_sys_object():
-            self._actions.extend(['create', 'alter', 'drop'])
+            self._actions = self._USER_ACTIONS
     def _get_create_sql(self, **params) -> str:
         "Returns SQL command to CREATE sequence."
         self._check_params(params, ['value', 'increment'])
@@ -2051,8 +2304,7 @@ class Sequence(SchemaItem):
         return f'DROP {self.schema.opt_generator_keyword} {self.get_quoted_name()}'
     def _get_comment_sql(self, **params) -> str:
         "Returns SQL command to COMMENT sequence."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
+        comment = _sql_string_lit(self.description)
         return f'COMMENT ON {self.schema.opt_generator_keyword} {self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$GENERATOR_NAME']
@@ -2074,12 +2326,12 @@ class Sequence(SchemaItem):
     def security_class(self) -> str:
         """Security class name or None.
         """
-        return self._attributes.get('RDB$SECURITY_CLASS')
+        return self._get_stripped('RDB$SECURITY_CLASS')
     @property
     def owner_name(self) -> str:
         """Creator's user name.
         """
-        return self._attributes.get('RDB$OWNER_NAME')
+        return self._get_stripped('RDB$OWNER_NAME')
     @property
     def inital_value(self) -> int:
         """Initial sequence value.
@@ -2100,18 +2352,16 @@ class TableColumn(SchemaItem):
           expression=computed_by_expr, restart=None_or_init_value)
         - System column: `comment`
     """
+    __slots__ = ('__privileges', '__table')
+    _STRIP_COLS = ('RDB$FIELD_NAME', 'RDB$RELATION_NAME', 'RDB$FIELD_SOURCE', 'RDB$GENERATOR_NAME')
+    _type_code = (ObjectType.DOMAIN, ObjectType.COLUMN)
+    _ACTIONS = ('comment',)
+    _USER_ACTIONS = ('comment', 'alter', 'drop')
     def __init__(self, schema: Schema, table: Table, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.extend([ObjectType.DOMAIN, ObjectType.COLUMN])
-        self.__table = weakref.proxy(table)
-        self._strip_attribute('RDB$FIELD_NAME')
-        self._strip_attribute('RDB$RELATION_NAME')
-        self._strip_attribute('RDB$FIELD_SOURCE')
-        self._strip_attribute('RDB$SECURITY_CLASS')
-        self._strip_attribute('RDB$GENERATOR_NAME')
-        self._actions.append('comment')
+        self.__table: Table = table
         if not self.is_sys_object():
-            self._actions.extend(['alter', 'drop'])
+            self._actions = self._USER_ACTIONS
         self.__privileges: DataList = None
     def _get_alter_sql(self, **params) -> str:
         "Returns SQL command to ALTER table column."
@@ -2120,9 +2370,10 @@ class TableColumn(SchemaItem):
         new_type = params.get('datatype')
         new_name = params.get('name')
         new_position = params.get('position')
-        if new_expr and not self.is_computed():
+        computed = self.is_computed()
+        if new_expr and not computed:
             raise ValueError("Change from persistent column to computed is not allowed.")
-        if self.is_computed() and (new_type and not new_expr):
+        if computed and (new_type and not new_expr):
             raise ValueError("Change from computed column to persistent is not allowed.")
         sql = f'ALTER TABLE {self.table.get_quoted_name()} ALTER COLUMN {self.get_quoted_name()}'
         if new_name:
@@ -2130,14 +2381,10 @@ class TableColumn(SchemaItem):
         if new_position:
             return f'{sql} POSITION {new_position}'
         if new_type or new_expr:
-            result = sql
-            if new_type:
-                result += f' TYPE {new_type}'
-            if new_expr:
-                result += f' COMPUTED BY {new_expr}'
-            return result
+            return f"{sql}{f' TYPE {new_type}' if new_type else ''}" \
+                   f"{f' COMPUTED BY {new_expr}' if new_expr else ''}"
         if 'restart' in params:
-            restart = params.get('restart')
+            restart = params['restart']
             sql += ' RESTART'
             if restart is not None:
                 sql += f' WITH {restart}'
@@ -2149,21 +2396,22 @@ class TableColumn(SchemaItem):
         return f'ALTER TABLE {self.table.get_quoted_name()} DROP {self.get_quoted_name()}'
     def _get_comment_sql(self, **params) -> str:
         "Returns SQL command to COMMENT table column."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
+        comment = _sql_string_lit(self.description)
         return f'COMMENT ON COLUMN {self.table.get_quoted_name()}.{self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$FIELD_NAME']
     def get_dependents(self) -> DataList[Dependency]:
         """Return list of all database objects that depend on this one.
         """
-        return self.schema.dependencies.extract(lambda d: d.depended_on_name == self._attributes['RDB$RELATION_NAME']
-                and d.depended_on_type == 0 and d.field_name == self.name, copy=True)
+        deps = self.schema._get_dependency_index()[0].get(self._attributes['RDB$RELATION_NAME'], ())
+        return DataList((d for d in deps if d.depended_on_type == 0 and d.field_name == self.name),
+                        Dependency)
     def get_dependencies(self) -> DataList[Dependency]:
         """Return list of database objects that this object depend on.
         """
-        return self.schema.dependencies.extract(lambda d: d.dependent_name == self._attributes['RDB$RELATION_NAME']
-                and d.dependent_type == 0 and d.field_name == self.name, copy=True)
+        deps = self.schema._get_dependency_index()[1].get(self._attributes['RDB$RELATION_NAME'], ())
+        return DataList((d for d in deps if d.dependent_type == 0 and d.field_name == self.name),
+                        Dependency)
     def get_computedby(self) -> str:
         """Returns extression for column computation or None.
         """
@@ -2183,15 +2431,15 @@ class TableColumn(SchemaItem):
     def is_writable(self) -> bool:
         """Returns True if column is writable (i.e. it's not computed etc.).
         """
-        return bool(self._attributes['RDB$UPDATE_FLAG'])
+        return self._attributes['RDB$UPDATE_FLAG'] == 1
     def is_identity(self) -> bool:
         """Returns True for identity type column.
         """
-        return self._attributes.get('RDB$IDENTITY_TYPE') is not None
+        return self._attributes['RDB$IDENTITY_TYPE'] is not None
     def has_default(self) -> bool:
         """Returns True if column has default value.
         """
-        return bool(self._attributes.get('RDB$DEFAULT_SOURCE'))
+        return bool(self._attributes['RDB$DEFAULT_SOURCE'])
     @property
     def id(self) -> int:
         """Internam number ID for the column.
@@ -2216,12 +2464,12 @@ class TableColumn(SchemaItem):
     def security_class(self) -> str:
         """Security class name or None.
         """
-        return self._attributes['RDB$SECURITY_CLASS']
+        return self._get_stripped('RDB$SECURITY_CLASS')
     @property
     def default(self) -> str:
         """Default value for column or None.
         """
-        result = self._attributes.get('RDB$DEFAULT_SOURCE')
+        result = self._attributes['RDB$DEFAULT_SOURCE']
         if result:
             if result.upper().startswith('DEFAULT '):
                 result = result[8:]
@@ -2241,20 +2489,20 @@ class TableColumn(SchemaItem):
     def privileges(self) -> DataList[Privilege]:
         """List of privileges granted to column.
         """
-        return self.schema.privileges.extract(lambda p: (p.subject_name == self.table.name and
-                                                        p.field_name == self.name and
-                                                        p.subject_type in self.table._type_code),
-                                                     copy = True)
+        table = self.table
+        return DataList((p for p in self.schema._get_privilege_index()[1].get(table.name, ())
+                         if p.field_name == self.name and p.subject_type in table._type_code),
+                        Privilege)
     @property
     def generator(self) -> Sequence:
         """Identity `.Sequence`.
         """
-        return self.schema.all_generators.get(self._attributes.get('RDB$GENERATOR_NAME'))
+        return self.schema.all_generators.get(self._attributes['RDB$GENERATOR_NAME'])
     @property
     def identity_type(self) -> int:
         """Identity type, None for normal columns.
         """
-        return self._attributes.get('RDB$IDENTITY_TYPE')
+        return self._attributes['RDB$IDENTITY_TYPE']
 
 class Index(SchemaItem):
     """Represents database index.
@@ -2263,17 +2511,18 @@ class Index(SchemaItem):
         - User index: `create`, `activate`, `deactivate`, `recompute`, `drop`, `comment`
         - System index: `activate`, `recompute`, `comment`
     """
+    __slots__ = ('__segment_names', '__segment_statistics')
+    _STRIP_COLS = ('RDB$INDEX_NAME', 'RDB$RELATION_NAME', 'RDB$FOREIGN_KEY')
+    _type_code = (ObjectType.INDEX_EXPR, ObjectType.INDEX)
+    _ACTIONS = ('activate', 'recompute', 'comment')
+    _USER_ACTIONS = ('activate', 'recompute', 'comment', 'create', 'deactivate', 'drop')
+    _COMMENT_KEYWORD = 'INDEX'
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.extend([ObjectType.INDEX_EXPR, ObjectType.INDEX])
         self.__segment_names = None
         self.__segment_statistics = None
-        self._strip_attribute('RDB$INDEX_NAME')
-        self._strip_attribute('RDB$RELATION_NAME')
-        self._strip_attribute('RDB$FOREIGN_KEY')
-        self._actions.extend(['activate', 'recompute', 'comment'])
         if not self.is_sys_object():
-            self._actions.extend(['create', 'deactivate', 'drop'])
+            self._actions = self._USER_ACTIONS
     def _get_create_sql(self, **params) -> str:
         "Returns SQL command to CREATE index."
         self._check_params(params, [])
@@ -2296,16 +2545,12 @@ class Index(SchemaItem):
         "Returns SQL command to DROP index."
         self._check_params(params, [])
         return f'DROP INDEX {self.get_quoted_name()}'
-    def _get_comment_sql(self, **params) -> str:
-        "Returns SQL command to COMMENT index."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
-        return f'COMMENT ON INDEX {self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$INDEX_NAME']
     def is_sys_object(self) -> bool:
         """Returns True if this database object is system object.
         """
+        # Not cached, as it depends on constraints that could be reloaded
         return bool(self._attributes['RDB$SYSTEM_FLAG']
                     or (self.is_enforcer() and self.name.startswith('RDB$')))
     def is_expression(self) -> bool:
@@ -2362,9 +2607,8 @@ class Index(SchemaItem):
         """
         if self.__segment_names is None:
             if self._attributes['RDB$SEGMENT_COUNT'] > 0:
-                self.__segment_names = [r['RDB$FIELD_NAME'].strip() for r
-                                        in self.schema._select("""select rdb$field_name
-from rdb$index_segments where rdb$index_name = ? order by rdb$field_position""", (self.name,))]
+                self.__segment_names = [name for name, _ in
+                                        self.schema._get_index_segments().get(self.name, ())]
             else:
                 self.__segment_names = []
         return self.__segment_names
@@ -2374,9 +2618,8 @@ from rdb$index_segments where rdb$index_name = ? order by rdb$field_position""",
         """
         if self.__segment_statistics is None:
             if self._attributes['RDB$SEGMENT_COUNT'] > 0:
-                self.__segment_statistics = [r['RDB$STATISTICS'] for r
-                                             in self.schema._select("""select RDB$STATISTICS
-from rdb$index_segments where rdb$index_name = ? order by rdb$field_position""", (self.name,))]
+                self.__segment_statistics = [statistics for _, statistics in
+                                             self.schema._get_index_segments().get(self.name, ())]
             else:
                 self.__segment_statistics = []
         return self.__segment_statistics
@@ -2397,7 +2640,7 @@ from rdb$index_segments where rdb$index_name = ? order by rdb$field_position""",
 
         .. versionadded:: 1.4.0
         """
-        return self._attributes['RDB$CONDITION_SOURCE']
+        return self._attributes.get('RDB$CONDITION_SOURCE')
 
 class ViewColumn(SchemaItem):
     """Represents view column.
@@ -2405,34 +2648,32 @@ class ViewColumn(SchemaItem):
     Supported SQL actions:
         `comment`
     """
+    __slots__ = ('__view',)
+    _STRIP_COLS = ('RDB$FIELD_NAME', 'RDB$BASE_FIELD', 'RDB$RELATION_NAME', 'RDB$FIELD_SOURCE',
+                   'BASE_RELATION')
+    _type_code = (ObjectType.DOMAIN, ObjectType.COLUMN)
+    _ACTIONS = ('comment',)
     def __init__(self, schema: Schema, view: View, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.extend([ObjectType.DOMAIN, ObjectType.COLUMN])
-        self.__view = weakref.proxy(view)
-        self._strip_attribute('RDB$FIELD_NAME')
-        self._strip_attribute('RDB$BASE_FIELD')
-        self._strip_attribute('RDB$RELATION_NAME')
-        self._strip_attribute('RDB$FIELD_SOURCE')
-        self._strip_attribute('RDB$SECURITY_CLASS')
-        self._strip_attribute('BASE_RELATION')
-        self._actions.append('comment')
+        self.__view: View = view
     def _get_comment_sql(self, **params) -> str:
         "Returns SQL command to CREATE view column."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
+        comment = _sql_string_lit(self.description)
         return f'COMMENT ON COLUMN {self.view.get_quoted_name()}.{self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$FIELD_NAME']
     def get_dependents(self) -> DataList[Dependency]:
         """Return list of all database objects that depend on this one.
         """
-        return self.schema.dependencies.extract(lambda d: d.depended_on_name == self._attributes['RDB$RELATION_NAME']
-                and d.depended_on_type == 1 and d.field_name == self.name, copy=True)
+        deps = self.schema._get_dependency_index()[0].get(self._attributes['RDB$RELATION_NAME'], ())
+        return DataList((d for d in deps if d.depended_on_type == 1 and d.field_name == self.name),
+                        Dependency)
     def get_dependencies(self) -> DataList[Dependency]:
         """Return list of database objects that this object depend on.
         """
-        return self.schema.dependencies.extract(lambda d: d.dependent_name == self._attributes['RDB$RELATION_NAME']
-                and d.dependent_type == 1 and d.field_name == self.name, copy=True)
+        deps = self.schema._get_dependency_index()[1].get(self._attributes['RDB$RELATION_NAME'], ())
+        return DataList((d for d in deps if d.dependent_type == 1 and d.field_name == self.name),
+                        Dependency)
     def is_nullable(self) -> bool:
         """Returns True if column is NULLABLE.
         """
@@ -2440,7 +2681,7 @@ class ViewColumn(SchemaItem):
     def is_writable(self) -> bool:
         """Returns True if column is writable.
         """
-        return bool(self._attributes['RDB$UPDATE_FLAG'])
+        return self._attributes['RDB$UPDATE_FLAG'] == 1
     @property
     def base_field(self) -> Union[TableColumn, ViewColumn, ProcedureParameter]:
         """The source column from the base relation. Result could be either `.TableColumn`,
@@ -2476,7 +2717,7 @@ class ViewColumn(SchemaItem):
     def security_class(self) -> str:
         """Security class name or None.
         """
-        return self._attributes['RDB$SECURITY_CLASS']
+        return self._get_stripped('RDB$SECURITY_CLASS')
     @property
     def collation(self) -> Collation:
         """Collation object or None.
@@ -2493,9 +2734,8 @@ class ViewColumn(SchemaItem):
         """List of privileges granted to column.
         """
         # Views are logged as Tables in RDB$USER_PRIVILEGES
-        return self.schema.privileges.extract(lambda p: (p.subject_name == self.view.name and
-                                                         p.field_name == self.name and
-                                                         p.subject_type == 0), copy=True)
+        return DataList((p for p in self.schema._get_privilege_index()[1].get(self.view.name, ())
+                         if p.field_name == self.name and p.subject_type == 0), Privilege)
 
 class Domain(SchemaItem):
     """Represents SQl Domain.
@@ -2506,15 +2746,17 @@ class Domain(SchemaItem):
           check=string_definition_or_None, datatype=string_SQLTypeDef)
         - System domain: `comment`
     """
+    __slots__ = ('__datatype',)
+    _STRIP_COLS = ('RDB$FIELD_NAME',)
+    _type_code = (ObjectType.COLUMN,)
+    _ACTIONS = ('comment',)
+    _USER_ACTIONS = ('comment', 'create', 'alter', 'drop')
+    _COMMENT_KEYWORD = 'DOMAIN'
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.append(ObjectType.COLUMN)
-        self._strip_attribute('RDB$FIELD_NAME')
-        self._strip_attribute('RDB$SECURITY_CLASS')
-        self._strip_attribute('RDB$OWNER_NAME')
-        self._actions.append('comment')
+        self.__datatype: str = None
         if not self.is_sys_object():
-            self._actions.extend(['create', 'alter', 'drop'])
+            self._actions = self._USER_ACTIONS
     def _get_create_sql(self, **params) -> str:
         "Returns SQL command to CREATE domain."
         self._check_params(params, [])
@@ -2526,8 +2768,9 @@ class Domain(SchemaItem):
         if self.is_validated():
             sql += ' ' + self.validation
         if self._attributes['RDB$COLLATION_ID']:
-            if self.character_set._attributes['RDB$DEFAULT_COLLATE_NAME'] != self.collation.name:
-                sql += f' COLLATE {self.collation.get_quoted_name()}'
+            collation = self.collation
+            if self.character_set._attributes['RDB$DEFAULT_COLLATE_NAME'] != collation.name:
+                sql += f' COLLATE {collation.get_quoted_name()}'
         return sql
     def _get_alter_sql(self, **params) -> str:
         "Returns SQL command to ALTER domain."
@@ -2554,16 +2797,9 @@ class Domain(SchemaItem):
         "Returns SQL command to DROP domain."
         self._check_params(params, [])
         return f'DROP DOMAIN {self.get_quoted_name()}'
-    def _get_comment_sql(self, **params) -> str:
-        "Returns SQL command to COMMENT dimain."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
-        return f'COMMENT ON DOMAIN {self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$FIELD_NAME']
-    def is_sys_object(self) -> bool:
-        """Return True if this database object is system object.
-        """
+    def _check_sys_object(self) -> bool:
         return (self._attributes['RDB$SYSTEM_FLAG'] == 1) or self.name.startswith('RDB$')
     def is_nullable(self) -> bool:
         """Returns True if domain is not defined with NOT NULL.
@@ -2678,6 +2914,10 @@ class Domain(SchemaItem):
     def datatype(self) -> str:
         """Comlete SQL datatype definition.
         """
+        if self.__datatype is None:
+            self.__datatype = self._get_datatype()
+        return self.__datatype
+    def _get_datatype(self) -> str:
         l = []
         precision_known = False
         if self.field_type in (FieldType.SHORT, FieldType.LONG, FieldType.INT64):
@@ -2716,12 +2956,12 @@ class Domain(SchemaItem):
     def security_class(self) -> str:
         """Security class name or None.
         """
-        return self._attributes.get('RDB$SECURITY_CLASS')
+        return self._get_stripped('RDB$SECURITY_CLASS')
     @property
     def owner_name(self) -> str:
         """Creator's user name.
         """
-        return self._attributes.get('RDB$OWNER_NAME')
+        return self._get_stripped('RDB$OWNER_NAME')
 
 class Dependency(SchemaItem):
     """Maps dependency between database objects.
@@ -2729,12 +2969,11 @@ class Dependency(SchemaItem):
     Supported SQL actions:
         `none`
     """
+    __slots__ = ()
+    _STRIP_COLS = ('RDB$DEPENDENT_NAME', 'RDB$DEPENDED_ON_NAME', 'RDB$FIELD_NAME',
+                   'RDB$PACKAGE_NAME')
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._strip_attribute('RDB$DEPENDENT_NAME')
-        self._strip_attribute('RDB$DEPENDED_ON_NAME')
-        self._strip_attribute('RDB$FIELD_NAME')
-        self._strip_attribute('RDB$PACKAGE_NAME')
     def is_sys_object(self) -> bool:
         """Returns True as dependency entries are considered as system objects.
         """
@@ -2891,21 +3130,15 @@ class Constraint(SchemaItem):
         - Constraint on user table except NOT NULL constraint: `create`, `drop`
         - Constraint on system table: `none`
     """
+    __slots__ = ()
+    _STRIP_COLS = ('RDB$CONSTRAINT_NAME', 'RDB$CONSTRAINT_TYPE', 'RDB$RELATION_NAME',
+                   'RDB$DEFERRABLE', 'RDB$INITIALLY_DEFERRED', 'RDB$INDEX_NAME', 'RDB$TRIGGER_NAME',
+                   'RDB$CONST_NAME_UQ', 'RDB$MATCH_OPTION', 'RDB$UPDATE_RULE', 'RDB$DELETE_RULE')
+    _USER_ACTIONS = ('create', 'drop')
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._strip_attribute('RDB$CONSTRAINT_NAME')
-        self._strip_attribute('RDB$CONSTRAINT_TYPE')
-        self._strip_attribute('RDB$RELATION_NAME')
-        self._strip_attribute('RDB$DEFERRABLE')
-        self._strip_attribute('RDB$INITIALLY_DEFERRED')
-        self._strip_attribute('RDB$INDEX_NAME')
-        self._strip_attribute('RDB$TRIGGER_NAME')
-        self._strip_attribute('RDB$CONST_NAME_UQ')
-        self._strip_attribute('RDB$MATCH_OPTION')
-        self._strip_attribute('RDB$UPDATE_RULE')
-        self._strip_attribute('RDB$DELETE_RULE')
         if not (self.is_sys_object() or self.is_not_null()):
-            self._actions.extend(['create', 'drop'])
+            self._actions = self._USER_ACTIONS
     def _get_create_sql(self, **params) -> str:
         "Returns SQL command to CREATE constraint."
         self._check_params(params, [])
@@ -2921,14 +3154,14 @@ class Constraint(SchemaItem):
             if not i.is_sys_object():
                 const_def += f'\n  USING {i.index_type.value} INDEX {i.get_quoted_name()}'
         elif self.is_fkey():
-            const_def += f"FOREIGN KEY ({','.join(self.index.segment_names)})\n  "
+            i = self.index
+            const_def += f"FOREIGN KEY ({','.join(i.segment_names)})\n  "
             p = self.partner_constraint
             const_def += f"REFERENCES {p.table.get_quoted_name()} ({','.join(p.index.segment_names)})"
             if self.delete_rule != 'RESTRICT':
                 const_def += f'\n  ON DELETE {self.delete_rule}'
             if self.update_rule != 'RESTRICT':
                 const_def += f'\n  ON UPDATE {self.update_rule}'
-            i = self.index
             if not i.is_sys_object():
                 const_def += f'\n  USING {i.index_type.value} INDEX {i.get_quoted_name()}'
         else:
@@ -2943,6 +3176,7 @@ class Constraint(SchemaItem):
     def is_sys_object(self) -> bool:
         """Returns True if this database object is system object.
         """
+        # Not cached, as it depends on tables that could be reloaded
         return self.schema.all_tables.get(self._attributes['RDB$RELATION_NAME']).is_sys_object()
     def is_not_null(self) -> bool:
         """Returns True if it's NOT NULL constraint.
@@ -3038,17 +3272,17 @@ class Table(SchemaItem):
           `drop`, `comment`, `insert (update=bool, returning=list[str], matching=list[str])`
         - System table: `comment`
     """
+    __slots__ = ('__columns',)
+    _STRIP_COLS = ('RDB$RELATION_NAME',)
+    _type_code = (ObjectType.TABLE,)
+    _ACTIONS = ('comment',)
+    _USER_ACTIONS = ('comment', 'create', 'recreate', 'drop')
+    _COMMENT_KEYWORD = 'TABLE'
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.append(ObjectType.TABLE)
         self.__columns = None
-        self._strip_attribute('RDB$RELATION_NAME')
-        self._strip_attribute('RDB$OWNER_NAME')
-        self._strip_attribute('RDB$SECURITY_CLASS')
-        self._strip_attribute('RDB$DEFAULT_CLASS')
-        self._actions.append('comment')
         if not self.is_sys_object():
-            self._actions.extend(['create', 'recreate', 'drop'])
+            self._actions = self._USER_ACTIONS
     def _get_insert_sql(self, **params) -> str:
         "Returns SQL command to INSERT data to table."
         try:
@@ -3093,8 +3327,8 @@ class Table(SchemaItem):
                     coldef += datatype
                 if col.is_identity():
                     coldef += ' GENERATED BY DEFAULT AS IDENTITY'
-                    if col.generator.inital_value != 0:
-                        coldef += f' (START WITH {col.generator.inital_value})'
+                    if (start := col.generator.inital_value) != 0:
+                        coldef += f' (START WITH {start})'
                 else:
                     if col.has_default():
                         coldef += f' DEFAULT {col.default}'
@@ -3102,8 +3336,8 @@ class Table(SchemaItem):
                         coldef += ' NOT NULL'
                     if col._attributes['RDB$COLLATION_ID'] is not None:
                         # Sometimes RDB$COLLATION_ID has a garbage value
-                        if col.collation is not None:
-                            cname = col.collation.name
+                        if (collation := col.collation) is not None:
+                            cname = collation.name
                             if col.domain.character_set._attributes['RDB$DEFAULT_COLLATE_NAME'] != cname:
                                 collate = cname
                 if collate:
@@ -3139,11 +3373,6 @@ class Table(SchemaItem):
         "Returns SQL command to DROP table."
         self._check_params(params, [])
         return f'DROP TABLE {self.get_quoted_name()}'
-    def _get_comment_sql(self, **params) -> str:
-        "Returns SQL command to COMMENT table."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
-        return f'COMMENT ON TABLE {self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$RELATION_NAME']
     def is_gtt(self) -> bool:
@@ -3197,7 +3426,7 @@ class Table(SchemaItem):
     def security_class(self) -> str:
         """Security class that define access limits to the table.
         """
-        return self._attributes['RDB$SECURITY_CLASS']
+        return self._get_stripped('RDB$SECURITY_CLASS')
     @property
     def external_file(self) -> str:
         """Full path to the external data file, if any.
@@ -3207,12 +3436,12 @@ class Table(SchemaItem):
     def owner_name(self) -> str:
         """User name of table's creator.
         """
-        return self._attributes['RDB$OWNER_NAME']
+        return self._get_stripped('RDB$OWNER_NAME')
     @property
     def default_class(self) -> str:
         """Default security class.
         """
-        return self._attributes['RDB$DEFAULT_CLASS']
+        return self._get_stripped('RDB$DEFAULT_CLASS')
     @property
     def flags(self) -> int:
         """Internal flags.
@@ -3240,8 +3469,8 @@ class Table(SchemaItem):
                     'RDB$GENERATOR_NAME', 'RDB$IDENTITY_TYPE']
             cmd = f"select {','.join(cols)} from RDB$RELATION_FIELDS " \
                   f"where RDB$RELATION_NAME = ? order by RDB$FIELD_POSITION"
-            self.__columns = DataList((TableColumn(self.schema, self, row) for row
-                                       in self.schema._select(cmd, (self.name,))),
+            self.__columns = DataList([TableColumn(self.schema, self, row) for row
+                                       in self.schema._select(self.schema._prepare(cmd), (self.name,))],
                                       TableColumn, 'item.name', frozen=True)
         return self.__columns
     @property
@@ -3266,9 +3495,8 @@ class Table(SchemaItem):
     def privileges(self) -> DataList[Privilege]:
         """List of privileges to table.
         """
-        return self.schema.privileges.extract(lambda p: ((p.subject_name == self.name) and
-                                                         (p.subject_type in self._type_code)),
-                                                     copy=True)
+        return DataList((p for p in self.schema._get_privilege_index()[1].get(self.name, ())
+                         if p.subject_type in self._type_code), Privilege)
 
 class View(SchemaItem):
     """Represents database View.
@@ -3278,18 +3506,17 @@ class View(SchemaItem):
           `create_or_alter`, `drop`, `comment`
         - System views: `comment`
     """
+    __slots__ = ('__columns',)
+    _STRIP_COLS = ('RDB$RELATION_NAME', 'RDB$VIEW_SOURCE')
+    _type_code = (ObjectType.VIEW,)
+    _ACTIONS = ('comment',)
+    _USER_ACTIONS = ('comment', 'create', 'recreate', 'alter', 'create_or_alter', 'drop')
+    _COMMENT_KEYWORD = 'VIEW'
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.append(ObjectType.VIEW)
         self.__columns = None
-        self._strip_attribute('RDB$RELATION_NAME')
-        self._strip_attribute('RDB$VIEW_SOURCE')
-        self._strip_attribute('RDB$OWNER_NAME')
-        self._strip_attribute('RDB$SECURITY_CLASS')
-        self._strip_attribute('RDB$DEFAULT_CLASS')
-        self._actions.append('comment')
         if not self.is_sys_object():
-            self._actions.extend(['create', 'recreate', 'alter', 'create_or_alter', 'drop'])
+            self._actions = self._USER_ACTIONS
     def _get_create_sql(self, **params) -> str:
         "Returns SQL command to CREATE view."
         self._check_params(params, [])
@@ -3314,11 +3541,6 @@ class View(SchemaItem):
         "Returns SQL command to DROP view."
         self._check_params(params, [])
         return f'DROP VIEW {self.get_quoted_name()}'
-    def _get_comment_sql(self, **params) -> str:
-        "Returns SQL command to COMMENT view."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
-        return f'COMMENT ON VIEW {self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$RELATION_NAME']
     def has_checkoption(self) -> bool:
@@ -3349,17 +3571,17 @@ class View(SchemaItem):
     def security_class(self) -> str:
         """Security class that define access limits to the view.
         """
-        return self._attributes['RDB$SECURITY_CLASS']
+        return self._get_stripped('RDB$SECURITY_CLASS')
     @property
     def owner_name(self) -> str:
         """User name of view's creator.
         """
-        return self._attributes['RDB$OWNER_NAME']
+        return self._get_stripped('RDB$OWNER_NAME')
     @property
     def default_class(self) -> str:
         """Default security class.
         """
-        return self._attributes['RDB$DEFAULT_CLASS']
+        return self._get_stripped('RDB$DEFAULT_CLASS')
     @property
     def flags(self) -> int:
         """Internal flags.
@@ -3370,15 +3592,15 @@ class View(SchemaItem):
         """List of columns defined for view.
         """
         if self.__columns is None:
-            self.__columns = DataList((ViewColumn(self.schema, self, row) for row
-                                       in self.schema._select("""select r.RDB$FIELD_NAME,
+            self.__columns = DataList([ViewColumn(self.schema, self, row) for row
+                                       in self.schema._select(self.schema._prepare("""select r.RDB$FIELD_NAME,
 r.RDB$RELATION_NAME, r.RDB$FIELD_SOURCE, r.RDB$FIELD_POSITION, r.RDB$UPDATE_FLAG,
 r.RDB$FIELD_ID, r.RDB$DESCRIPTION, r.RDB$SYSTEM_FLAG, r.RDB$SECURITY_CLASS, r.RDB$NULL_FLAG,
 r.RDB$DEFAULT_SOURCE, r.RDB$COLLATION_ID, r.RDB$BASE_FIELD, v.RDB$RELATION_NAME as BASE_RELATION
     from RDB$RELATION_FIELDS r
     left join RDB$VIEW_RELATIONS v on r.RDB$VIEW_CONTEXT = v.RDB$VIEW_CONTEXT and v.rdb$view_name = ?
     where r.RDB$RELATION_NAME = ?
-    order by RDB$FIELD_POSITION""", (self.name, self.name))), ViewColumn, 'item.name', frozen=True)
+    order by RDB$FIELD_POSITION"""), (self.name, self.name))], ViewColumn, 'item.name', frozen=True)
         return self.__columns
     @property
     def triggers(self) -> DataList[Trigger]:
@@ -3392,8 +3614,8 @@ r.RDB$DEFAULT_SOURCE, r.RDB$COLLATION_ID, r.RDB$BASE_FIELD, v.RDB$RELATION_NAME
         """List of privileges granted to view.
         """
         # Views are logged as Tables in RDB$USER_PRIVILEGES
-        return self.schema.privileges.extract(lambda p: ((p.subject_name == self.name) and
-                                                         (p.subject_type == 0)), copy=True)
+        return DataList((p for p in self.schema._get_privilege_index()[1].get(self.name, ())
+                         if p.subject_type == 0), Privilege)
 
 class Trigger(SchemaItem):
     """Represents trigger.
@@ -3403,16 +3625,16 @@ class Trigger(SchemaItem):
           `alter` (fire_on=string, active=bool,sequence=int, declare=string_or_list, code=string_or_list)
         - System trigger: `comment`
     """
+    __slots__ = ('__m',)
+    _STRIP_COLS = ('RDB$TRIGGER_NAME', 'RDB$RELATION_NAME', 'RDB$ENGINE_NAME', 'RDB$ENTRYPOINT')
+    _type_code = (ObjectType.TRIGGER,)
+    _ACTIONS = ('comment',)
+    _USER_ACTIONS = ('comment', 'create', 'recreate', 'alter', 'create_or_alter', 'drop')
+    _COMMENT_KEYWORD = 'TRIGGER'
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.append(ObjectType.TRIGGER)
-        self._strip_attribute('RDB$TRIGGER_NAME')
-        self._strip_attribute('RDB$RELATION_NAME')
-        self._strip_attribute('RDB$ENGINE_NAME')
-        self._strip_attribute('RDB$ENTRYPOINT')
-        self._actions.append('comment')
         if not self.is_sys_object():
-            self._actions.extend(['create', 'recreate', 'alter', 'create_or_alter', 'drop'])
+            self._actions = self._USER_ACTIONS
         self.__m = list(DMLTrigger.__members__.values())
     def _get_create_sql(self, **params) -> str:
         "Returns SQL command to CREATE trigger."
@@ -3439,7 +3661,7 @@ class Trigger(SchemaItem):
             header += ' ACTIVE' if active else ' INACTIVE'
         if action is not None:
             dbaction = action.upper().startswith('ON ')
-            if (dbaction and not self.is_db_trigger()) or (not dbaction and self.is_db_trigger()):
+            if dbaction != self.is_db_trigger():
                 raise ValueError("Trigger type change is not allowed.")
             header += f'\n  {action}'
         if sequence is not None:
@@ -3471,11 +3693,6 @@ class Trigger(SchemaItem):
         "Returns SQL command to DROP trigger."
         self._check_params(params, [])
         return f'DROP TRIGGER {self.get_quoted_name()}'
-    def _get_comment_sql(self, **params) -> str:
-        "Returns SQL command to COMMENT trigger."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
-        return f'COMMENT ON TRIGGER {self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$TRIGGER_NAME']
     def __ru(self, value: IntEnum) -> str:
@@ -3607,20 +3824,16 @@ class ProcedureParameter(SchemaItem):
     Supported SQL actions:
         `comment`
     """
+    __slots__ = ('__proc',)
+    _STRIP_COLS = ('RDB$PARAMETER_NAME', 'RDB$PROCEDURE_NAME', 'RDB$FIELD_SOURCE',
+                   'RDB$RELATION_NAME', 'RDB$FIELD_NAME', 'RDB$PACKAGE_NAME')
+    _ACTIONS = ('comment',)
     def __init__(self, schema: Schema, proc: Procedure, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
         self.__proc: Procedure = proc
-        self._strip_attribute('RDB$PARAMETER_NAME')
-        self._strip_attribute('RDB$PROCEDURE_NAME')
-        self._strip_attribute('RDB$FIELD_SOURCE')
-        self._strip_attribute('RDB$RELATION_NAME')
-        self._strip_attribute('RDB$FIELD_NAME')
-        self._strip_attribute('RDB$PACKAGE_NAME')
-        self._actions.append('comment')
     def _get_comment_sql(self, **params) -> str:
         "Returns SQL command to COMMENT procedure parameter."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
+        comment = _sql_string_lit(self.description)
         return f'COMMENT ON PARAMETER {self.procedure.get_quoted_name()}.{self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$PARAMETER_NAME']
@@ -3648,7 +3861,7 @@ class ProcedureParameter(SchemaItem):
     def is_nullable(self) -> bool:
         """Returns True if parameter allows NULL.
         """
-        return not bool(self._attributes.get('RDB$NULL_FLAG'))
+        return not self._attributes.get('RDB$NULL_FLAG')
     def has_default(self) -> bool:
         """Returns True if parameter has default value.
         """
@@ -3747,49 +3960,49 @@ class Procedure(SchemaItem):
           `alter` (input=string_or_list, output=string_or_list, declare=string_or_list, code=string_or_list)
         - System procedure: `comment`
     """
+    __slots__ = ('__colsql', '__input_params', '__output_params')
+    _STRIP_COLS = ('RDB$PROCEDURE_NAME', 'RDB$ENGINE_NAME', 'RDB$ENTRYPOINT', 'RDB$PACKAGE_NAME')
+    _type_code = (ObjectType.PROCEDURE,)
+    _ACTIONS = ('comment',)
+    _USER_ACTIONS = ('comment', 'create', 'recreate', 'alter', 'create_or_alter', 'drop')
+    _COMMENT_KEYWORD = 'PROCEDURE'
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.append(ObjectType.PROCEDURE)
         self.__input_params = self.__output_params = None
-        self._strip_attribute('RDB$PROCEDURE_NAME')
-        self._strip_attribute('RDB$OWNER_NAME')
-        self._strip_attribute('RDB$SECURITY_CLASS')
-        self._strip_attribute('RDB$ENGINE_NAME')
-        self._strip_attribute('RDB$ENTRYPOINT')
-        self._strip_attribute('RDB$PACKAGE_NAME')
         self.__colsql = "select RDB$PARAMETER_NAME, RDB$PROCEDURE_NAME, RDB$PARAMETER_NUMBER," \
                         "RDB$PARAMETER_TYPE, RDB$FIELD_SOURCE, RDB$DESCRIPTION, RDB$SYSTEM_FLAG," \
                         "RDB$DEFAULT_SOURCE, RDB$COLLATION_ID, RDB$NULL_FLAG, RDB$PARAMETER_MECHANISM," \
                         "RDB$FIELD_NAME, RDB$RELATION_NAME, RDB$PACKAGE_NAME " \
                         "from rdb$procedure_parameters where rdb$procedure_name = ? " \
                         "and rdb$parameter_type = ? order by rdb$parameter_number"
-        self._actions.append('comment')
         if not self.is_sys_object():
-            self._actions.extend(['create', 'recreate', 'alter', 'create_or_alter', 'drop'])
+            self._actions = self._USER_ACTIONS
     def _get_create_sql(self, **params) -> str:
         "Returns SQL command to CREATE procedure."
         self._check_params(params, ['no_code'])
-        no_code = params.get('no_code')
-        result = f'CREATE PROCEDURE {self.get_quoted_name()}'
+        return self._get_definition_sql('CREATE', params.get('no_code'))
+    def _get_definition_sql(self, verb: str, no_code: bool=False) -> str:
+        "Returns full procedure definition as SQL command starting with `verb`."
+        result = f'{verb} PROCEDURE {self.get_quoted_name()}'
         if self.has_input():
-            if self._attributes['RDB$PROCEDURE_INPUTS'] == 1:
+            if (count := self._attributes['RDB$PROCEDURE_INPUTS']) == 1:
                 result += f' ({self.input_params[0].get_sql_definition()})\n'
             else:
                 result += ' (\n'
                 for p in self.input_params:
                     result += f"  {p.get_sql_definition()}" \
-                              f"{'' if p.sequence+1 == self._attributes['RDB$PROCEDURE_INPUTS'] else ','}\n"
+                              f"{'' if p.sequence+1 == count else ','}\n"
                 result += ')\n'
         else:
             result += '\n'
         if self.has_output():
-            if self._attributes['RDB$PROCEDURE_OUTPUTS'] == 1:
+            if (count := self._attributes['RDB$PROCEDURE_OUTPUTS']) == 1:
                 result += f'RETURNS ({self.output_params[0].get_sql_definition()})\n'
             else:
                 result += 'RETURNS (\n'
                 for p in self.output_params:
                     result += f"  {p.get_sql_definition()}" \
-                              f"{'' if p.sequence+1 == self._attributes['RDB$PROCEDURE_OUTPUTS'] else ','}\n"
+                              f"{'' if p.sequence+1 == count else ','}\n"
                 result += ')\n'
         return result+'AS\n'+(('BEGIN\nEND' if self.proc_type != 1
                                else 'BEGIN\n  SUSPEND;\nEND')
@@ -3863,11 +4076,6 @@ class Procedure(SchemaItem):
         "Returns SQL command to DROP procedure."
         self._check_params(params, [])
         return f'DROP PROCEDURE {self.get_quoted_name()}'
-    def _get_comment_sql(self, **params) -> str:
-        "Returns SQL command to COMMENT procedure."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
-        return f'COMMENT ON PROCEDURE {self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$PROCEDURE_NAME']
     def get_param(self, name: str) -> ProcedureParameter:
@@ -3906,24 +4114,24 @@ class Procedure(SchemaItem):
     def security_class(self) -> str:
         """Security class that define access limits to the procedure.
         """
-        return self._attributes['RDB$SECURITY_CLASS']
+        return self._get_stripped('RDB$SECURITY_CLASS')
     @property
     def owner_name(self) -> str:
         """User name of procedure's creator.
         """
-        return self._attributes['RDB$OWNER_NAME']
+        return self._get_stripped('RDB$OWNER_NAME')
     @property
     def input_params(self) -> DataList[ProcedureParameter]:
         """List of input parameters.
         """
         if self.__input_params is None:
             if self.has_input():
-                self.__input_params = DataList((ProcedureParameter(self.schema, self, row) for row in
-                                                  self.schema._select(self.__colsql, (self.name, 0))),
-                                                 ProcedureParameter, 'item.name')
+                self.__input_params = DataList([ProcedureParameter(self.schema, self, row) for row in
+                                                  self.schema._select(self.schema._prepare(self.__colsql),
+                                                                     (self.name, 0))],
+                                                 ProcedureParameter, 'item.name', frozen=True)
             else:
-                self.__input_params = DataList()
-            self.__input_params.freeze()
+                self.__input_params = DataList(frozen=True)
         return self.__input_params
     @property
     def output_params(self) -> DataList[ProcedureParameter]:
@@ -3931,20 +4139,19 @@ class Procedure(SchemaItem):
         """
         if self.__output_params is None:
             if self.has_output():
-                self.__output_params = DataList((ProcedureParameter(self.schema, self, row) for row in
-                                                   self.schema._select(self.__colsql, (self.name, 1))),
-                                                  ProcedureParameter, 'item.name')
+                self.__output_params = DataList([ProcedureParameter(self.schema, self, row) for row in
+                                                   self.schema._select(self.schema._prepare(self.__colsql),
+                                                                      (self.name, 1))],
+                                                  ProcedureParameter, 'item.name', frozen=True)
             else:
-                self.__output_params = DataList()
-            self.__output_params.freeze()
+                self.__output_params = DataList(frozen=True)
         return self.__output_params
     @property
     def privileges(self) -> DataList[Privilege]:
         """List of privileges granted to procedure.
         """
-        return self.schema.privileges.extract(lambda p: ((p.subject_name == self.name) and
-                                                         (p.subject_type in self._type_code)),
-                                                     copy=True)
+        return DataList((p for p in self.schema._get_privilege_index()[1].get(self.name, ())
+                         if p.subject_type in self._type_code), Privilege)
     @property
     def proc_type(self) -> ProcedureType:
         """Procedure type.
@@ -3983,15 +4190,16 @@ class Role(SchemaItem):
         - User role: `create`, `drop`, `comment`
         - System role: `comment`
     """
+    __slots__ = ()
+    _STRIP_COLS = ('RDB$ROLE_NAME',)
+    _type_code = (ObjectType.ROLE,)
+    _ACTIONS = ('comment',)
+    _USER_ACTIONS = ('comment', 'create', 'drop')
+    _COMMENT_KEYWORD = 'ROLE'
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.append(ObjectType.ROLE)
-        self._strip_attribute('RDB$ROLE_NAME')
-        self._strip_attribute('RDB$OWNER_NAME')
-        self._strip_attribute('RDB$SECURITY_CLASS')
-        self._actions.append('comment')
         if not self.is_sys_object():
-            self._actions.extend(['create', 'drop'])
+            self._actions = self._USER_ACTIONS
     def _get_create_sql(self, **params) -> str:
         "Returns SQL command to CREATE role."
         self._check_params(params, [])
@@ -4000,30 +4208,24 @@ class Role(SchemaItem):
         "Returns SQL command to DROP role."
         self._check_params(params, [])
         return f'DROP ROLE {self.get_quoted_name()}'
-    def _get_comment_sql(self, **params) -> str:
-        "Returns SQL command to COMMENT role."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
-        return f'COMMENT ON ROLE {self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$ROLE_NAME']
     @property
     def owner_name(self) -> str:
         """User name of role owner.
         """
-        return self._attributes['RDB$OWNER_NAME']
+        return self._get_stripped('RDB$OWNER_NAME')
     @property
     def security_class(self) -> str:
         """Security class name or None.
         """
-        return self._attributes.get('RDB$SECURITY_CLASS')
+        return self._get_stripped('RDB$SECURITY_CLASS')
     @property
     def privileges(self) -> DataList[Privilege]:
         """List of privileges granted to role.
         """
-        return self.schema.privileges.extract(lambda p: ((p.user_name == self.name) and
-                                                         (p.user_type in self._type_code)),
-                                                     copy=True)
+        return DataList((p for p in self.schema._get_privilege_index()[0].get(self.name, ())
+                         if p.user_type in self._type_code), Privilege)
 
 class FunctionArgument(SchemaItem):
     """Represets UDF argument.
@@ -4031,18 +4233,13 @@ class FunctionArgument(SchemaItem):
     Supported SQL actions:
         `none`
     """
+    __slots__ = ('__function',)
+    _STRIP_COLS = ('RDB$FUNCTION_NAME', 'RDB$PACKAGE_NAME', 'RDB$ARGUMENT_NAME', 'RDB$FIELD_SOURCE',
+                   'RDB$DEFAULT_SOURCE', 'RDB$FIELD_NAME', 'RDB$RELATION_NAME', 'RDB$DESCRIPTION')
+    _type_code = (ObjectType.UDF,)
     def __init__(self, schema: Schema, function: Function, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.append(ObjectType.UDF)
         self.__function = function
-        self._strip_attribute('RDB$FUNCTION_NAME')
-        self._strip_attribute('RDB$PACKAGE_NAME')
-        self._strip_attribute('RDB$ARGUMENT_NAME')
-        self._strip_attribute('RDB$FIELD_SOURCE')
-        self._strip_attribute('RDB$DEFAULT_SOURCE')
-        self._strip_attribute('RDB$FIELD_NAME')
-        self._strip_attribute('RDB$RELATION_NAME')
-        self._strip_attribute('RDB$DESCRIPTION')
     def _get_name(self) -> str:
         return self.argument_name or f'{self.function.name}_{self.position}'
     def get_sql_definition(self) -> str:
@@ -4092,7 +4289,7 @@ class FunctionArgument(SchemaItem):
     def is_nullable(self) -> bool:
         """Returns True if parameter allows NULL.
         """
-        return not bool(self._attributes.get('RDB$NULL_FLAG'))
+        return not self._attributes.get('RDB$NULL_FLAG')
     def has_default(self) -> bool:
         """Returns True if parameter has default value.
         """
@@ -4267,25 +4464,23 @@ class Function(SchemaItem):
           `alter` (arguments=string_or_list, returns=string, declare=string_or_list, code=string_or_list)
         - System UDF: `none`
     """
+    __slots__ = ('__arguments', '__returns')
+    _STRIP_COLS = ('RDB$FUNCTION_NAME', 'RDB$MODULE_NAME', 'RDB$ENTRYPOINT', 'RDB$ENGINE_NAME',
+                   'RDB$PACKAGE_NAME')
+    _type_code = (ObjectType.UDF,)
+    #: SQL actions supported by external functions (UDF).
+    _EXTERNAL_ACTIONS = ('comment', 'declare', 'drop')
+    _USER_ACTIONS = ('create', 'recreate', 'alter', 'create_or_alter', 'drop')
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.append(ObjectType.UDF)
         self.__arguments = None
         self.__returns = None
-        self._strip_attribute('RDB$FUNCTION_NAME')
-        self._strip_attribute('RDB$MODULE_NAME')
-        self._strip_attribute('RDB$ENTRYPOINT')
-        self._strip_attribute('RDB$ENGINE_NAME')
-        self._strip_attribute('RDB$PACKAGE_NAME')
-        self._strip_attribute('RDB$SECURITY_CLASS')
-        self._strip_attribute('RDB$OWNER_NAME')
         if not self.is_sys_object():
             if self.is_external():
-                self._actions.extend(['comment', 'declare', 'drop'])
+                self._actions = self._EXTERNAL_ACTIONS
             else:
                 if self._attributes.get('RDB$PACKAGE_NAME') is None:
-                    self._actions.extend(['create', 'recreate', 'alter', 'create_or_alter',
-                                          'drop'])
+                    self._actions = self._USER_ACTIONS
 
     def _get_declare_sql(self, **params) -> str:
         "Returns SQL command to DECLARE function."
@@ -4305,15 +4500,16 @@ class Function(SchemaItem):
         return f"DROP{' EXTERNAL' if self.is_external() else ''} FUNCTION {self.get_quoted_name()}"
     def _get_comment_sql(self, **params) -> str:
         "Returns SQL command to COMMENT function."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
+        comment = _sql_string_lit(self.description)
         return f"COMMENT ON{' EXTERNAL' if self.is_external() else ''} " \
                f"FUNCTION {self.get_quoted_name()} IS {comment}"
     def _get_create_sql(self, **params) -> str:
         "Returns SQL command to CREATE function."
         self._check_params(params, ['no_code'])
-        no_code = params.get('no_code')
-        result = f'CREATE FUNCTION {self.get_quoted_name()}'
+        return self._get_definition_sql('CREATE', params.get('no_code'))
+    def _get_definition_sql(self, verb: str, no_code: bool=False) -> str:
+        "Returns full function definition as SQL command starting with `verb`."
+        result = f'{verb} FUNCTION {self.get_quoted_name()}'
         if self.has_arguments():
             if len(self.arguments) == 1:
                 result += f' ({self.arguments[0].get_sql_definition()})\n'
@@ -4379,17 +4575,10 @@ class Function(SchemaItem):
         #
         return f'ALTER FUNCTION {self.get_quoted_name()}{header}{body}'
     def _load_arguments(self, mock: Dict[str, Any]=None) -> None:
-        cols = ['RDB$FUNCTION_NAME', 'RDB$ARGUMENT_POSITION', 'RDB$MECHANISM',
-                'RDB$FIELD_TYPE', 'RDB$FIELD_SCALE', 'RDB$FIELD_LENGTH',
-                'RDB$FIELD_SUB_TYPE', 'RDB$CHARACTER_SET_ID', 'RDB$FIELD_PRECISION',
-                'RDB$CHARACTER_LENGTH', 'RDB$PACKAGE_NAME', 'RDB$ARGUMENT_NAME',
-                'RDB$FIELD_SOURCE', 'RDB$DEFAULT_SOURCE', 'RDB$COLLATION_ID', 'RDB$NULL_FLAG',
-                'RDB$ARGUMENT_MECHANISM', 'RDB$FIELD_NAME', 'RDB$RELATION_NAME',
-                'RDB$SYSTEM_FLAG', 'RDB$DESCRIPTION']
-        self.__arguments = DataList((FunctionArgument(self.schema, self, row) for row in
+        self.__arguments = DataList([FunctionArgument(self.schema, self, row) for row in
                                      (mock or
-                                      self.schema._select(f"""select {','.join(cols)} from rdb$function_arguments
-where rdb$function_name = ? order by rdb$argument_position""", (self.name,)))),
+                                      self.schema._select(self.schema._prepare(_SQL_FUNCTION_ARGUMENTS),
+                                                          (self.name,)))],
                                     FunctionArgument, frozen=True)
         rarg = self._attributes['RDB$RETURN_ARGUMENT']
         if rarg is not None:
@@ -4478,12 +4667,12 @@ where rdb$function_name = ? order by rdb$argument_position""", (self.name,)))),
     def security_class(self) -> str:
         """Security class.
         """
-        return self._attributes.get('RDB$SECURITY_CLASS')
+        return self._get_stripped('RDB$SECURITY_CLASS')
     @property
     def owner_name(self) -> str:
         """Owner name.
         """
-        return self._attributes.get('RDB$OWNER_NAME')
+        return self._get_stripped('RDB$OWNER_NAME')
     @property
     def legacy_flag(self) -> Legacy:
         """Legacy flag.
@@ -4501,9 +4690,10 @@ class DatabaseFile(SchemaItem):
     Supported SQL actions:
         `create`
     """
+    __slots__ = ()
+    _STRIP_COLS = ('RDB$FILE_NAME',)
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._strip_attribute('RDB$FILE_NAME')
     def _get_name(self) -> str:
         return f'FILE_{self.sequence}'
     def is_sys_object(self) -> bool:
@@ -4537,10 +4727,11 @@ class Shadow(SchemaItem):
     Supported SQL actions:
         `create`, `drop` (preserve=bool)
     """
+    __slots__ = ('__files',)
+    _ACTIONS = ('create', 'drop')
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
         self.__files = None
-        self._actions.extend(['create', 'drop'])
     def _get_create_sql(self, **params) -> str:
         "Returns SQL command to CREATE shadow."
         self._check_params(params, [])
@@ -4598,11 +4789,11 @@ class Shadow(SchemaItem):
         """List of shadow files.
         """
         if self.__files is None:
-            self.__files = DataList((DatabaseFile(self, row) for row
-                            in self.schema._select("""select RDB$FILE_NAME, RDB$FILE_SEQUENCE,
+            self.__files = DataList([DatabaseFile(self, row) for row
+                            in self.schema._select(self.schema._prepare("""select RDB$FILE_NAME, RDB$FILE_SEQUENCE,
 RDB$FILE_START, RDB$FILE_LENGTH from RDB$FILES
 where RDB$SHADOW_NUMBER = ?
-order by RDB$FILE_SEQUENCE""", (self._attributes['RDB$SHADOW_NUMBER'],))), frozen=True)
+order by RDB$FILE_SEQUENCE"""), (self._attributes['RDB$SHADOW_NUMBER'],))], frozen=True)
         return self.__files
 
 class Privilege(SchemaItem):
@@ -4611,22 +4802,18 @@ class Privilege(SchemaItem):
     Supported SQL actions:
         `grant` (grantors), `revoke` (grantors, grant_option)
     """
+    __slots__ = ()
+    _STRIP_COLS = ('RDB$USER', 'RDB$GRANTOR', 'RDB$PRIVILEGE', 'RDB$RELATION_NAME',
+                   'RDB$FIELD_NAME')
+    _ACTIONS = ('grant', 'revoke')
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._actions.extend(['grant', 'revoke'])
-        self._strip_attribute('RDB$USER')
-        self._strip_attribute('RDB$GRANTOR')
-        self._strip_attribute('RDB$PRIVILEGE')
-        self._strip_attribute('RDB$RELATION_NAME')
-        self._strip_attribute('RDB$FIELD_NAME')
     def _get_grant_sql(self, **params) -> str:
         "Returns SQL command to GRANT privilege."
         self._check_params(params, ['grantors'])
         grantors = params.get('grantors', ['SYSDBA'])
-        privileges = [PrivilegeCode.SELECT, PrivilegeCode.INSERT, PrivilegeCode.UPDATE,
-                      PrivilegeCode.DELETE, PrivilegeCode.REFERENCES]
         admin_option = ' WITH GRANT OPTION' if self.has_grant() else ''
-        if self.privilege in privileges:
+        if self.privilege in _TABLE_PRIVS:
             privilege = self.privilege.name
             if self.field_name is not None:
                 privilege += f'({self.field_name})'
@@ -4658,10 +4845,8 @@ class Privilege(SchemaItem):
         option_only = params.get('grant_option', False)
         if option_only and not self.has_grant():
             raise ValueError("Can't revoke grant option that wasn't granted.")
-        privileges = [PrivilegeCode.SELECT, PrivilegeCode.INSERT, PrivilegeCode.UPDATE,
-                      PrivilegeCode.DELETE, PrivilegeCode.REFERENCES]
         admin_option = 'GRANT OPTION FOR ' if self.has_grant() and option_only else ''
-        if self.privilege in privileges:
+        if self.privilege in _TABLE_PRIVS:
             privilege = self.privilege.name
             if self.field_name is not None:
                 privilege += f'([{self.field_name}])'
@@ -4792,14 +4977,13 @@ class Package(SchemaItem):
         `create` (body=bool), `recreate` (body=bool), `create_or_alter` (body=bool),
         `alter` (header=string_or_list), `drop` (body=bool)
     """
+    __slots__ = ()
+    _STRIP_COLS = ('RDB$PACKAGE_NAME',)
+    _type_code = (ObjectType.PACKAGE_HEADER, ObjectType.PACKAGE_BODY)
+    _ACTIONS = ('create', 'recreate', 'create_or_alter', 'alter', 'drop', 'comment')
+    _COMMENT_KEYWORD = 'PACKAGE'
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.extend([ObjectType.PACKAGE_HEADER, ObjectType.PACKAGE_BODY])
-        self._actions.extend(['create', 'recreate', 'create_or_alter', 'alter', 'drop',
-                              'comment'])
-        self._strip_attribute('RDB$PACKAGE_NAME')
-        self._strip_attribute('RDB$SECURITY_CLASS')
-        self._strip_attribute('RDB$OWNER_NAME')
     def _get_create_sql(self, **params) -> str:
         "Returns SQL command to CREATE package."
         self._check_params(params, ['body'])
@@ -4822,11 +5006,6 @@ class Package(SchemaItem):
         body = params.get('body')
         cbody = 'BODY ' if body else ''
         return f'DROP PACKAGE {cbody}{self.get_quoted_name()}'
-    def _get_comment_sql(self, **params) -> str:
-        "Returns SQL command to COMMENT package."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
-        return f'COMMENT ON PACKAGE {self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$PACKAGE_NAME']
     def has_valid_body(self) -> bool:
@@ -4847,12 +5026,12 @@ class Package(SchemaItem):
     def security_class(self) -> str:
         """Security class name or None.
         """
-        return self._attributes['RDB$SECURITY_CLASS']
+        return self._get_stripped('RDB$SECURITY_CLASS')
     @property
     def owner_name(self) -> str:
         """User name of package creator.
         """
-        return self._attributes['RDB$OWNER_NAME']
+        return self._get_stripped('RDB$OWNER_NAME')
     @property
     def functions(self) -> DataList[Function]:
         """List of package functions.
@@ -4872,9 +5051,10 @@ class BackupHistory(SchemaItem):
     Supported SQL actions:
         `None`
     """
+    __slots__ = ()
+    _STRIP_COLS = ('RDB$FILE_NAME',)
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._strip_attribute('RDB$FILE_NAME')
     def _get_name(self) -> str:
         return f'BCKP_{self.scn}'
     def is_sys_object(self) -> bool:
@@ -4919,14 +5099,15 @@ class Filter(SchemaItem):
         - BLOB filter: `declare`, `drop`, `comment`
         - System UDF: `none`
     """
+    __slots__ = ()
+    _STRIP_COLS = ('RDB$FUNCTION_NAME', 'RDB$MODULE_NAME', 'RDB$ENTRYPOINT')
+    _type_code = (ObjectType.BLOB_FILTER,)
+    _USER_ACTIONS = ('comment', 'declare', 'drop')
+    _COMMENT_KEYWORD = 'FILTER'
     def __init__(self, schema: Schema, attributes: Dict[str, Any]):
         super().__init__(schema, attributes)
-        self._type_code.append(ObjectType.BLOB_FILTER)
-        self._strip_attribute('RDB$FUNCTION_NAME')
-        self._strip_attribute('RDB$MODULE_NAME')
-        self._strip_attribute('RDB$ENTRYPOINT')
         if not self.is_sys_object():
-            self._actions.extend(['comment', 'declare', 'drop'])
+            self._actions = self._USER_ACTIONS
     def _get_declare_sql(self, **params) -> str:
         "Returns SQL command to DECLARE filter."
         self._check_params(params, [])
@@ -4937,11 +5118,6 @@ class Filter(SchemaItem):
         "Returns SQL command to DROP filter."
         self._check_params(params, [])
         return f'DROP FILTER {self.get_quoted_name()}'
-    def _get_comment_sql(self, **params) -> str:
-        "Returns SQL command to COMMENT filter."
-        comment = 'NULL' if self.description is None \
-            else f"'{escape_single_quotes(self.description)}'"
-        return f'COMMENT ON FILTER {self.get_quoted_name()} IS {comment}'
     def _get_name(self) -> str:
         return self._attributes['RDB$FUNCTION_NAME']
     @property
@@ -465,6 +465,21 @@ class TestSchema(TestBase):
         s.reload([Category.TABLES, Category.VIEWS])
         self.assertEqual(s.all_tables.get('COUNTRY').name, 'COUNTRY')
         self.assertEqual(s.all_views.get('PHONE_LIST').name, 'PHONE_LIST')
+        # Prepared metadata queries are reused after reload commits the transaction
+        self.assertListEqual([x.name for x in s.all_tables.get('COUNTRY').columns],
+                             ['COUNTRY', 'CURRENCY'])
+        self.assertEqual(s.all_procedures.get('GET_EMP_PROJ').input_params[0].name, 'EMP_NO')
+        s.reload()
+        self.assertListEqual([x.name for x in s.all_tables.get('COUNTRY').columns],
+                             ['COUNTRY', 'CURRENCY'])
+        self.assertEqual(s.all_procedures.get('GET_EMP_PROJ').input_params[0].name, 'EMP_NO')
+        # Prefetch
+        s.reload()
+        s.prefetch([Category.TABLES, Category.VIEWS])
+        self.assertEqual(s.all_tables.get('COUNTRY').name, 'COUNTRY')
+        self.assertEqual(s.all_views.get('PHONE_LIST').name, 'PHONE_LIST')
+        s.prefetch()
+        self.assertEqual(len(s.exceptions), 5)
     def test_03_Collation(self):
         s = Schema()
         s.bind(self.con)
@@ -672,6 +687,8 @@ class TestSchema(TestBase):
         self.assertEqual(c.inital_value, 0)
         self.assertEqual(c.increment, 1)
         self.assertEqual(c.value, 145)
+        self.assertDictEqual(s.get_sequence_values([c]), {'EMP_NO_GEN': 145})
+        self.assertEqual(s.get_sequence_values()['EMP_NO_GEN'], 145)
         #
         self.assertEqual(c.get_sql_for('create'), "CREATE SEQUENCE EMP_NO_GEN")
         self.assertEqual(c.get_sql_for('drop'), "DROP SEQUENCE EMP_NO_GEN")
@@ -819,6 +836,10 @@ class TestSchema(TestBase):
         self.assertIsNone(c.partner_index)
         self.assertIsNone(c.expression)
         self.assertIsNone(c.condition)
+        if self.version in (FB30, FB40):
+            # RDB$CONDITION_SOURCE is not loaded for ODS 13.0 and older
+            self.assertNotIn('RDB$CONDITION_SOURCE', c._attributes)
+            self.assertIsNone(c.condition)
         # startswith() is necessary, because Python 3 returns more precise value.
         self.assertTrue(str(c.statistics).startswith('0.0384615398943'))
         self.assertListEqual(c.segment_names, ['JOB_COUNTRY', 'MAX_SALARY'])
@@ -3337,6 +3358,34 @@ END""")
         self.assertListEqual(sm.get_grants(p.privileges),
                              ['GRANT EXECUTE ON PROCEDURE ORG_CHART TO PUBLIC WITH GRANT OPTION',
                               'GRANT EXECUTE ON PROCEDURE ORG_CHART TO SYSDBA'])
+        # get_grants() with privileges other than table ones
+        def priv(code, subject, subject_type, grant_option=0):
+            return sm.Privilege(s, {'RDB$USER': 'T_USER', 'RDB$GRANTOR': 'SYSDBA',
+                                    'RDB$PRIVILEGE': code, 'RDB$GRANT_OPTION': grant_option,
+                                    'RDB$RELATION_NAME': subject, 'RDB$FIELD_NAME': None,
+                                    'RDB$USER_TYPE': ObjectType.USER,
+                                    'RDB$OBJECT_TYPE': subject_type})
+        privs = [priv('X', 'ALL_LANGS', ObjectType.PROCEDURE),
+                 priv('X', 'FN_ABS', ObjectType.UDF),
+                 priv('M', 'TEST_ROLE', ObjectType.ROLE, 2),
+                 priv('G', 'EMP_NO_GEN', ObjectType.GENERATOR),
+                 priv('G', 'UNKNOWN_EMP_ID', ObjectType.EXCEPTION),
+                 priv('C', 'SQL$TABLES', ObjectType.RELATIONS),
+                 priv('L', 'SQL$TABLES', ObjectType.RELATIONS),
+                 priv('O', 'SQL$DATABASE', ObjectType.DATABASE)]
+        self.assertListEqual(sm.get_grants(privs),
+                             ['GRANT EXECUTE ON PROCEDURE ALL_LANGS TO T_USER',
+                              'GRANT USAGE ON SEQUENCE EMP_NO_GEN TO T_USER',
+                              'GRANT EXECUTE ON FUNCTION FN_ABS TO T_USER',
+                              'GRANT DROP DATABASE TO T_USER',
+                              'GRANT CREATE TABLE TO T_USER',
+                              'GRANT ALTER ANY TABLE TO T_USER',
+                              'GRANT TEST_ROLE TO T_USER WITH ADMIN OPTION',
+                              'GRANT USAGE ON EXCEPTION UNKNOWN_EMP_ID TO T_USER'])
+        with self.assertRaises(Error) as cm:
+            sm.get_grants([priv('G', 'COUNTRY', ObjectType.TABLE)])
+        self.assertTupleEqual(cm.exception.args,
+                              ("Unsupported privilege 'USAGE' on TABLE 'COUNTRY'",))
         #
     def test_25_Package(self):
         s = Schema()
@@ -3840,6 +3889,24 @@ DROP TABLE JOB
                                       'ALTER TRIGGER TR_MULTI ACTIVE',
                                       'ALTER TRIGGER TRIG_DDL_SP ACTIVE',
                                       'ALTER TRIGGER TRIG_DDL ACTIVE'])
+        # Iterator
+        self.assertListEqual(list(s.iter_metadata_ddl(sections=[sm.Section.TRIGGER_ACTIVATIONS])),
+                             script)
+        self.assertListEqual(list(s.iter_metadata_ddl()), s.get_metadata_ddl())
+    def test_28_ScriptParameterComments(self):
+        self.con.execute_immediate("COMMENT ON PARAMETER GET_EMP_PROJ.EMP_NO IS 'Employee number'")
+        self.con.commit()
+        try:
+            s = Schema()
+            s.bind(self.con)
+            script = s.get_metadata_ddl(sections=[sm.Section.COMMENTS])
+            self.assertListEqual(script,
+                                 ["COMMENT ON CHARACTER SET NONE IS 'Comment on NONE character set'",
+                                  "COMMENT ON PARAMETER GET_EMP_PROJ.EMP_NO IS 'Employee number'"])
+            s.close()
+        finally:
+            self.con.execute_immediate("COMMENT ON PARAMETER GET_EMP_PROJ.EMP_NO IS NULL")
+            self.con.commit()
 
 if __name__ == '__main__':
     unittest.main()